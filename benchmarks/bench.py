@@ -0,0 +1,394 @@
+"""
+Benchmark suite for SoftBoiled construction hot paths
+
+Reports operations per second, bytes allocated per operation, and bytes
+still held by the result of an operation for a set of payload shapes.
+Results can be saved as a baseline and later runs compared against it,
+failing when a case slows down past a threshold.
+
+Usage:
+    python benchmarks/bench.py
+    python benchmarks/bench.py --save benchmarks/baseline.json
+    python benchmarks/bench.py --compare benchmarks/baseline.json
+
+Author: Preocts, discord: Preocts#8196
+"""
+import argparse
+import dataclasses
+import json
+import logging
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from softboiled import coercion
+from softboiled import jsonstream
+from softboiled import SoftBoiled
+
+DEFAULT_THRESHOLD = 0.20
+REPEAT = 5
+REGISTERED_CLASSES = 500
+BATCH = 1_000
+
+Case = Callable[[], Any]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Flat:
+    id: str
+    name: str
+    role: str
+    email: str
+
+
+Wide = SoftBoiled(
+    dataclasses.make_dataclass("Wide", [(f"field{idx:02}", str) for idx in range(50)])
+)
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Deep:
+    value: int
+    child: Optional["Deep"] = None
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Team:
+    id: str
+    name: str
+    default_role: Optional[str]
+
+
+@SoftBoiled.options(slots=True)
+@dataclasses.dataclass
+class TeamSlots:
+    id: str
+    name: str
+    default_role: Optional[str]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class TeamInterned:
+    id: str
+    name: str = dataclasses.field(metadata={"intern": True})
+    default_role: Optional[str] = dataclasses.field(metadata={"intern": True})
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class User:
+    id: str
+    name: str
+    teams: List[Team]
+
+
+@SoftBoiled.options(lazy=True)
+@dataclasses.dataclass
+class LazyUser:
+    id: str
+    name: str
+    teams: List[Team]
+
+
+@SoftBoiled.options(validate=100)
+@dataclasses.dataclass
+class SampledUser:
+    id: str
+    name: str
+    teams: List[Team]
+
+
+@SoftBoiled.options(validate=1)
+@dataclasses.dataclass
+class ValidatedUser:
+    id: str
+    name: str
+    teams: List[Team]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class CodegenTeam:
+    id: str
+    name: str
+    default_role: Optional[str]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class CodegenUser:
+    id: str
+    name: str
+    teams: List[CodegenTeam]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Scored:
+    id: int
+    active: bool
+    score: float
+
+
+@SoftBoiled.options(coerce=True)
+@dataclasses.dataclass
+class ScoredCoerced:
+    id: int
+    active: bool
+    score: float
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Sparse:
+    field01: str
+    field02: str
+    field03: str
+    field04: str
+    field05: str
+    field06: str
+    field07: str
+    field08: str
+
+
+def _registered() -> Any:
+    """Register many classes, returning one whose nested field is found by name"""
+    for idx in range(REGISTERED_CLASSES):
+        SoftBoiled(dataclasses.make_dataclass(f"Filler{idx}", [("id", int)]))
+
+    return SoftBoiled(
+        dataclasses.make_dataclass("Crowded", [("id", int), ("team", "Team")])
+    )
+
+
+def _codegen(*models: Any) -> None:
+    """Compile the plans of the models with generated cleaners"""
+    original = SoftBoiled.codegen
+    SoftBoiled.codegen = True
+    try:
+        for model in models:
+            SoftBoiled.getplan(model.cls)
+    finally:
+        SoftBoiled.codegen = original
+
+
+def _second_pass(records: List[Dict[str, Any]]) -> List[Any]:
+    """Build without coercion then convert each field, as before coercion"""
+    instances = Scored.load_many(records)
+    for instance in instances:
+        instance.id = coercion.to_int(instance.id)
+        instance.active = coercion.to_bool(instance.active)
+        instance.score = coercion.to_float(instance.score)
+    return instances
+
+
+def _uncompiled(payload: Dict[str, Any]) -> Any:
+    """Build a User with its plans compiled again, as before plans were cached"""
+    SoftBoiled.plans.pop(User.cls, None)
+    SoftBoiled.plans.pop(Team.cls, None)
+    return User(**payload)
+
+
+def _deep(depth: int) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"value": depth, "extra": "dropped"}
+    if depth:
+        payload["child"] = _deep(depth - 1)
+    return payload
+
+
+def cases() -> Dict[str, Case]:
+    """Returns each benchmark case by name"""
+    team = {"id": "T1", "name": "One", "default_role": "manager", "type": "team"}
+    flat = {"id": "P1", "name": "Flat", "role": "admin", "email": "a@b.c"}
+    wide = {f"field{idx:02}": "value" for idx in range(50)}
+    wide.update({f"unused{idx:02}": "value" for idx in range(50)})
+    user = {"id": "P1", "name": "User", "teams": [team] * 20, "extra": True}
+    deep = _deep(20)
+    sparse = {"field01": "only one", "unused": "value"}
+    document = json.dumps(
+        {**user, **{f"unused{idx:02}": f"value {idx}" for idx in range(40)}}
+    ).encode()
+    crowded = _registered()
+    flats = [flat] * BATCH
+    teams = [team] * BATCH
+    _codegen(CodegenUser, CodegenTeam)
+    built = Team.load_many(teams)
+    scores = [{"id": str(idx), "active": "true", "score": "1.5"} for idx in range(100)]
+    teams_document = json.dumps(
+        [
+            {"id": str(idx), "name": f"Team {idx % 3}", "default_role": "observer"}
+            for idx in range(BATCH)
+        ]
+    )
+    nested = User(**user)
+    columns = Team.load_columns(teams)
+
+    return {
+        "flat": lambda: Flat(**flat),
+        "wide": lambda: Wide(**wide),
+        "deep_nested": lambda: Deep(**deep),
+        "list_of_nested": lambda: User(**user),
+        "list_of_nested_uncompiled": lambda: _uncompiled(user),
+        "list_of_nested_codegen": lambda: CodegenUser(**user),
+        "list_of_nested_lazy": lambda: LazyUser(**user),
+        "list_of_nested_validate_100": lambda: SampledUser(**user),
+        "list_of_nested_validate_all": lambda: ValidatedUser(**user),
+        "json_loads_wide": lambda: User(**json.loads(document)),
+        "from_json_wide": lambda: User.from_json(document),
+        "team_batch_json": lambda: Team.from_json(teams_document),
+        "team_batch_json_interned": lambda: TeamInterned.from_json(teams_document),
+        "coerce_second_pass": lambda: _second_pass(scores),
+        "coerce_inline": lambda: ScoredCoerced.load_many(scores),
+        "asdict": lambda: dataclasses.asdict(nested),
+        "to_dict": lambda: User.to_dict(nested),
+        "many_registered": lambda: crowded(id=1, team=team),
+        "missing_heavy": lambda: Sparse(**sparse),
+        "flat_batch_calls": lambda: [Flat(**record) for record in flats],
+        "flat_batch_load_many": lambda: Flat.load_many(flats),
+        "team_batch": lambda: Team.load_many(teams),
+        "team_batch_slots": lambda: TeamSlots.load_many(teams),
+        "team_batch_columns": lambda: Team.load_columns(teams),
+        "team_batch_scan": lambda: [instance.id for instance in built],
+        "team_batch_columns_scan": lambda: list(columns.column("id")),
+    }
+
+
+def measure(case: Case) -> Dict[str, float]:
+    """
+    Measure one case, the best of several timed runs
+
+    Allocation is the peak traced memory of a single operation, kept is the
+    traced memory still held while its result is alive.
+
+    Args:
+        case: Called with no arguments to run one operation
+    """
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+    tracemalloc.start()
+    result = case()
+    kept, allocated = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "ops_per_sec": round(1 / best, 1),
+        "bytes_per_op": allocated,
+        "bytes_kept": kept,
+    }
+
+
+def run(names: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Run the named cases, or all of them
+
+    Args:
+        names: Names of the cases to run
+    """
+    selected = cases()
+    if names:
+        selected = {name: selected[name] for name in names}
+
+    return {name: measure(case) for name, case in selected.items()}
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """
+    Returns the names of cases slower than the baseline by more than threshold
+
+    Args:
+        results: Results of the current run
+        baseline: Saved results to compare against
+        threshold: Allowed fraction of ops/sec lost, e.g. 0.2 for 20%
+    """
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline
+        and result["ops_per_sec"] < baseline[name]["ops_per_sec"] * (1 - threshold)
+    ]
+
+
+def report(
+    results: Dict[str, Dict[str, float]],
+    baseline: Optional[Dict[str, Dict[str, float]]] = None,
+) -> str:
+    """Format results as a table, with the change from baseline when given"""
+    lines = [f"{'case':<30}{'ops/sec':>14}{'bytes/op':>12}{'kept':>12}{'change':>10}"]
+
+    for name, result in results.items():
+        change = ""
+        if baseline and name in baseline:
+            ratio = result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+            change = f"{ratio:+.1%}"
+
+        lines.append(
+            f"{name:<30}{result['ops_per_sec']:>14,.0f}"
+            f"{result['bytes_per_op']:>12,.0f}"
+            f"{result.get('bytes_kept', 0):>12,.0f}{change:>10}"
+        )
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point, returns the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("cases", nargs="*", help="names of cases to run")
+    parser.add_argument("--save", metavar="PATH", help="save results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="fraction of ops/sec lost before failing (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.getLogger("SoftBoiled").setLevel(logging.ERROR)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as infile:
+            baseline = json.load(infile)["results"]
+
+    results = run(args.cases)
+    print(report(results, baseline))
+
+    if args.save:
+        with open(args.save, "w") as outfile:
+            saved = {
+                "python": platform.python_version(),
+                "orjson": jsonstream.orjson is not None,
+                "results": results,
+            }
+            json.dump(saved, outfile, indent=2)
+            outfile.write("\n")
+
+    slower = compare(results, baseline, args.threshold) if baseline else []
+    if slower:
+        print(f"Slower than baseline: {', '.join(slower)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
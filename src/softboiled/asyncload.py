@@ -0,0 +1,74 @@
+"""
+Asyncio loaders consuming async iterators of SoftBoiled records
+
+Records are gathered from the async source into batches. Each batch is
+decoded and built in an executor so the event loop stays responsive,
+while the next batch is read from the source.
+
+Author: Preocts, discord: Preocts#8196
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+from softboiled import jsonstream
+
+DEFAULT_BATCH_SIZE = 1_000
+
+Record = Union[Dict[str, Any], str, bytes]
+
+
+async def load_records(
+    model: Any,
+    source: AsyncIterable[Record],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Any]:
+    """
+    Yield instances of model, in order, from an async source of records
+
+    At most one batch is built while the following batch is read.
+
+    Args:
+        model: The SoftBoiled decorated class
+        source: Async iterable of dicts, or JSON object lines as str or bytes
+        batch_size: Number of records built in the executor at a time
+        executor: Executor to build batches in, defaults to the loop default
+    """
+    loop = asyncio.get_running_loop()
+    pending: Optional["asyncio.Future[List[Any]]"] = None
+    batch: List[Record] = []
+
+    async for record in source:
+        batch.append(record)
+        if len(batch) < batch_size:
+            continue
+
+        if pending is not None:
+            for instance in await pending:
+                yield instance
+
+        pending = loop.run_in_executor(executor, _load_batch, model, batch)
+        batch = []
+
+    if pending is not None:
+        for instance in await pending:
+            yield instance
+
+    if batch:
+        for instance in await loop.run_in_executor(executor, _load_batch, model, batch):
+            yield instance
+
+
+def _load_batch(model: Any, batch: List[Record]) -> List[Any]:
+    """Executor: decode JSON lines and build instances from a batch"""
+    return model.load_many(
+        jsonstream.loads(record) if isinstance(record, (str, bytes)) else record
+        for record in batch
+    )
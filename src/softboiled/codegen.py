@@ -0,0 +1,125 @@
+"""
+Generates specialized cleaning functions for SoftBoiled dataclasses
+
+In the same spirit as dataclasses generating `__init__`, the key
+filtering, default filling, and nested construction for a known set of
+fields is written out as source and compiled once per class. The
+generated function follows the same steps, in the same order, as the
+generic SoftBoiled cleaning pipeline.
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Type
+
+Cleaner = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def make_cleaner(
+    cls: Type[Any],
+    fields: Sequence[Any],
+    warn: Callable[[Type[Any], str], None],
+    defer: Optional[Callable[[Callable[[Any], Any], Any], Any]] = None,
+    overflow: Optional[str] = None,
+    intern: Optional[Callable[[Any], Any]] = None,
+) -> Cleaner:
+    """
+    Generate and compile the cleaning function of a dataclass
+
+    Args:
+        cls: The raw dataclass being cleaned for
+        fields: Field plans of the dataclass, in field order
+        warn: Called with the class and field name of a missing required value
+        defer: When given, called with the builder and raw value of a nested
+            field in place of building it
+        overflow: When given, name of the field receiving the unknown keys
+        intern: When given, called with the value of each interned field
+    """
+    namespace: Dict[str, Any] = {
+        "_cls": cls,
+        "_warn": warn,
+        "_defer": defer,
+        "_intern": intern,
+        "_expected": frozenset(
+            name for field in fields for name in (field.name, *field.aliases)
+        ),
+    }
+    nested: List[str] = []
+    plain: List[str] = []
+    extra: List[str] = []
+    checks: List[str] = []
+    items: List[str] = []
+
+    for idx, field in enumerate(fields):
+        key = repr(field.name)
+        keys = [key, *(repr(alias) for alias in field.aliases)]
+        var = f"_v{idx}"
+        items.append(f"{key}: {var}")
+
+        if field.factory is not None:
+            namespace[f"_f{idx}"] = field.factory
+            default = f"_f{idx}()"
+        else:
+            namespace[f"_d{idx}"] = field.default
+            default = f"_d{idx}"
+
+        # The field name is read first, then each alias in declared order
+        if field.builder is None:
+            read = "data[{}]"
+            if field.converter is not None:
+                namespace[f"_c{idx}"] = field.converter
+                read = f"_c{idx}({read})"
+            if intern and field.intern:
+                read = f"_intern({read})"
+            found = [f"{read.format(name)} if {name} in data else " for name in keys]
+            plain.append(f"    {var} = {''.join(found)}{default}")
+        else:
+            namespace[f"_b{idx}"] = field.builder
+            build = "_defer(_b{}, data[{}])" if defer else "_b{}(data[{}])"
+            for pos, name in enumerate(keys):
+                nested.extend(
+                    [
+                        f"    {'elif' if pos else 'if'} {name} in data:",
+                        f"        {var} = {build.format(idx, name)}",
+                    ]
+                )
+            nested.extend(["    else:", f"        {var} = {default}"])
+
+        if field.name == overflow:
+            extra.extend(
+                [
+                    "    _extra = {",
+                    "        k: v for k, v in data.items() if k not in _expected",
+                    "    }",
+                    "    if _extra:",
+                    f"        if isinstance({var}, dict):",
+                    f"            {var} = {{**{var}, **_extra}}",
+                    f"        elif {var} is not None:",
+                    f"            {var} = {{{key}: {var}, **_extra}}",
+                    "        else:",
+                    f"            {var} = _extra",
+                ]
+            )
+
+        if not field.optional:
+            checks.extend([f"    if {var} is None:", f"        _warn(_cls, {key})"])
+
+    lines = [
+        "def _clean(data):",
+        *nested,
+        *plain,
+        *extra,
+        *checks,
+        f"    return {{{', '.join(items)}}}",
+    ]
+
+    exec("\n".join(lines), namespace)  # nosec: source built from field names
+
+    cleaner: Cleaner = namespace["_clean"]
+    cleaner.__qualname__ = f"{cls.__qualname__}._softboiled_clean"
+    return cleaner
@@ -0,0 +1,151 @@
+"""
+Converters selected once per field from resolved type hints
+
+A converter turns the raw value of a field into the annotated type when
+the value arrived as something else, most often a string. Values that
+cannot be converted are returned unchanged, keeping with SoftBoiled
+creating the instance regardless. None is never converted.
+
+Author: Preocts, discord: Preocts#8196
+"""
+import datetime
+import enum
+import functools
+import typing
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+from softboiled import nesting
+
+Converter = Callable[[Any], Any]
+
+TRUE_STRINGS = frozenset({"true", "t", "yes", "y", "on", "1"})
+FALSE_STRINGS = frozenset({"false", "f", "no", "n", "off", "0"})
+
+
+def make_converter(
+    hint: Any,
+    func: Optional[Callable[[Any], Any]] = None,
+) -> Optional[Converter]:
+    """
+    Returns the converter of a field, None if its type has no converter
+
+    Args:
+        hint: The resolved type hint of the field, Optional is unwrapped
+        func: Converter given in field metadata, used in place of the hint
+    """
+    if func is not None:
+        return functools.partial(_unless_none, func)
+
+    hint = _unwrap_optional(hint)
+
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        return functools.partial(to_enum, hint)
+
+    try:
+        return CONVERTERS.get(hint)
+    except TypeError:  # Unhashable type hints
+        return None
+
+
+def to_int(value: Any) -> Any:
+    """Convert str, and floats without a fraction, to int"""
+    if type(value) is str:
+        try:
+            return int(value)
+        except ValueError:
+            return value
+
+    if type(value) is float and value.is_integer():
+        return int(value)
+
+    return value
+
+
+def to_float(value: Any) -> Any:
+    """Convert str and int to float"""
+    if type(value) is str or type(value) is int:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    return value
+
+
+def to_bool(value: Any) -> Any:
+    """Convert strings such as "true" and "no", and the ints 0 and 1, to bool"""
+    if type(value) is str:
+        lowered = value.strip().lower()
+        if lowered in TRUE_STRINGS:
+            return True
+        if lowered in FALSE_STRINGS:
+            return False
+        return value
+
+    if type(value) is int and value in (0, 1):
+        return bool(value)
+
+    return value
+
+
+def to_datetime(value: Any) -> Any:
+    """Convert ISO 8601 strings, including a trailing "Z", to datetime"""
+    if type(value) is not str:
+        return value
+
+    try:
+        return datetime.datetime.fromisoformat(_utc(value))
+    except ValueError:
+        return value
+
+
+def to_date(value: Any) -> Any:
+    """Convert ISO 8601 date strings to date"""
+    if type(value) is not str:
+        return value
+
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def to_enum(enumtype: Any, value: Any) -> Any:
+    """Convert a member value to the member of the enum"""
+    if value is None or isinstance(value, enumtype):
+        return value
+
+    try:
+        return enumtype(value)
+    except ValueError:
+        return value
+
+
+CONVERTERS: Dict[Any, Converter] = {
+    int: to_int,
+    float: to_float,
+    bool: to_bool,
+    datetime.datetime: to_datetime,
+    datetime.date: to_date,
+}
+
+
+def _unless_none(func: Callable[[Any], Any], value: Any) -> Any:
+    return None if value is None else func(value)
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    """Returns X of Optional[X], other hints unchanged"""
+    if typing.get_origin(hint) not in nesting.UNION_TYPES:
+        return hint
+
+    args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+    return args[0] if len(args) == 1 else hint
+
+
+def _utc(value: str) -> str:
+    """fromisoformat before Python 3.11 does not accept a trailing Z"""
+    return value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value
@@ -0,0 +1,132 @@
+"""
+Column oriented batches of SoftBoiled records
+
+Records of one class are held as one list per field rather than one
+object per record. Column scans touch only the values needed and
+instances are created only when a row is accessed.
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import overload
+from typing import Sequence
+from typing import Type
+from typing import Union
+
+from softboiled.lazy import Deferred
+
+
+class Columns(Sequence[Any]):
+    """A batch of records stored as one list of values per field"""
+
+    def __init__(self, cls: Type[Any], columns: Dict[str, List[Any]]) -> None:
+        """
+        Create a batch from existing columns, all of equal length
+
+        Args:
+            cls: The raw dataclass of the records
+            columns: Field name to list of values, in field order
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns must be the same length, got {lengths}")
+
+        self.cls = cls
+        self.columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        model: Type[Any],
+        names: Sequence[str],
+        rows: Iterable[Dict[str, Any]],
+    ) -> "Columns":
+        """
+        Create a batch from cleaned rows holding every field name
+
+        Args:
+            model: The raw dataclass of the records
+            names: Field names of the dataclass, in field order
+            rows: Cleaned key/value data, one dict per record
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in names}
+        appenders = [(name, columns[name].append) for name in names]
+
+        for row in rows:
+            for name, append in appenders:
+                append(row[name])
+
+        return cls(model, columns)
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Returns the values of one field for every record
+
+        Nested values of lazy classes are built and kept in the column.
+
+        Args:
+            name: Name of the field
+        """
+        values = self.columns[name]
+        for idx, value in enumerate(values):
+            if isinstance(value, Deferred):
+                values[idx] = value.resolve()
+        return values
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Returns the values of one record as a dict, without creating it
+
+        Nested values of lazy classes are built and kept in the columns.
+
+        Args:
+            index: Position of the record
+        """
+        row = self._raw(index)
+        for name, value in row.items():
+            if isinstance(value, Deferred):
+                row[name] = self.columns[name][index] = value.resolve()
+        return row
+
+    def _raw(self, index: int) -> Dict[str, Any]:
+        """Values of one record, nested values of lazy classes left unbuilt"""
+        return {name: values[index] for name, values in self.columns.items()}
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Create the instance, or list of instances, at index"""
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Columns index out of range")
+
+        return self.cls(**self._raw(index))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Create each instance as it is reached"""
+        cls = self.cls
+        names = list(self.columns)
+
+        for values in zip(*self.columns.values()):
+            yield cls(**dict(zip(names, values)))
+
+    def __repr__(self) -> str:
+        return f"Columns({self.cls.__qualname__}, {self._length} records)"
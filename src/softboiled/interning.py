@@ -0,0 +1,57 @@
+"""
+Bounded table of shared string values
+
+Fields declared with `dataclasses.field(metadata={"intern": True})` have
+their string values swapped for the first equal string seen, so values
+repeated across many records are held in memory once. The table stops
+taking new values once full; values already held are still shared.
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import Dict
+
+DEFAULT_MAXSIZE = 65_536
+
+
+class InternTable:
+    """Shares equal string values up to a maximum number of distinct values"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """
+        Create an empty table
+
+        Args:
+            maxsize: Most distinct values held by the table
+        """
+        self.maxsize = maxsize
+        self._values: Dict[str, str] = {}
+
+    def intern(self, value: Any) -> Any:
+        """
+        Returns the held string equal to value, other types are unchanged
+
+        Args:
+            value: The value of an interned field
+        """
+        if type(value) is not str:
+            return value
+
+        found = self._values.get(value)
+        if found is not None:
+            return found
+
+        if len(self._values) < self.maxsize:
+            self._values[value] = value
+
+        return value
+
+    def clear(self) -> None:
+        """Release every held value"""
+        self._values = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._values
@@ -0,0 +1,277 @@
+"""
+Incremental JSON readers with bounded memory
+
+Yields one decoded record at a time from JSON Lines or from an array
+held under a key of a top-level JSON object. Only the current record
+and a small read buffer are held in memory regardless of file size.
+Values of other keys are skipped by scanning, without being decoded.
+
+Documents and lines are decoded with orjson when it is installed, else
+with the standard library json module.
+
+Author: Preocts, discord: Preocts#8196
+"""
+import codecs
+import json
+import re
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import IO
+from typing import List
+from typing import Optional
+from typing import Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = " \t\n\r"
+DELIMITERS = WHITESPACE + ",:]}"
+
+# Skips text and complete strings, capturing the next bracket or the quote
+# opening a string not yet complete in the buffer
+_STRUCTURE = re.compile(
+    r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}"])'
+)
+# Next closing quote or escape inside of a string
+_STRING_END = re.compile(r'["\\]')
+# First character after a number, true, false, or null
+_SCALAR_END = re.compile(r"[\s,\]}]")
+
+_decoder = json.JSONDecoder()
+
+loads: Callable[[Union[str, bytes]], Any] = orjson.loads if orjson else json.loads
+
+
+def iter_jsonlines(fileobj: IO[Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each decoded line of a JSON Lines file, blank lines are skipped
+
+    Args:
+        fileobj: Text or binary file object of JSON Lines
+    """
+    for line in fileobj:
+        if line.strip():
+            yield loads(line)
+
+
+def iter_array(
+    fileobj: IO[Any],
+    key: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each element of the array under `key` of a top-level JSON object
+
+    Values of other keys are skipped without being decoded. Raises
+    ValueError if the document is not an object or `key` does not hold an
+    array.
+
+    Args:
+        fileobj: Text or binary file object of a single JSON document
+        key: Top-level key of the array to stream
+        chunk_size: Number of characters or bytes read at a time
+    """
+    reader = _Reader(fileobj, chunk_size)
+
+    reader.expect("{")
+
+    while reader.peek() != "}":
+        name = reader.decode()
+        reader.expect(":")
+
+        if name == key:
+            reader.expect("[")
+            yield from _iter_elements(reader)
+            return
+
+        reader.skip()
+        if reader.peek() == ",":
+            reader.expect(",")
+
+    raise ValueError(f"Key '{key}' not found in JSON object")
+
+
+def _iter_elements(reader: "_Reader") -> Iterator[Any]:
+    """Yield decoded elements until the end of the current array"""
+    if reader.peek() == "]":
+        return
+
+    while True:
+        yield reader.decode()
+
+        if reader.peek() == "]":
+            return
+
+        reader.expect(",")
+
+
+class _Reader:
+    """
+    Buffered text reader consuming one JSON value at a time
+
+    Values found whole in the buffer are decoded in place. Values spanning
+    the end of the buffer, and skipped values, are scanned for their end.
+    The scan resumes where it stopped after each read, so every character
+    is scanned once however many chunks a value spans.
+    """
+
+    def __init__(self, fileobj: IO[Any], chunk_size: int) -> None:
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        # Scan state of the value being consumed
+        self.depth = 0
+        self.instring = False
+        self.escaped = False
+
+    def fill(self) -> bool:
+        """Read another chunk into the buffer, returns False at end of file"""
+        if self.eof:
+            return False
+
+        chunk: Union[str, bytes] = self.fileobj.read(self.chunk_size)
+
+        if isinstance(chunk, bytes):
+            text = self.decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+
+        if not chunk:
+            self.eof = True
+
+        pos = self.pos
+        self.buffer = self.buffer[pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while self.pos < len(self.buffer):
+                if self.buffer[self.pos] not in WHITESPACE:
+                    return self.buffer[self.pos]
+                self.pos += 1
+
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON document, got '{found}'")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode and consume the next JSON value"""
+        self.peek()
+
+        # Most values fit in the buffer and decode in place. A value not
+        # followed by a delimiter, such as 1 of 1.5, may be cut short by the
+        # end of the buffer and is scanned for its end instead
+        try:
+            value, end = _decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if end < len(self.buffer) and self.buffer[end] in DELIMITERS:
+                self.pos = end
+                return value
+
+        return _decoder.decode(self.consume(keep=True))
+
+    def skip(self) -> None:
+        """Consume the next JSON value without decoding or holding it"""
+        self.consume(keep=False)
+
+    def consume(self, keep: bool) -> str:
+        """
+        Scan past the next JSON value, returns its text or "" if not kept
+
+        Buffered text before the end of the value is dropped after each
+        scan, so a skipped value never holds more than one chunk.
+        """
+        first = self.peek()
+        scalar = first not in '"[{'
+        self.depth = 0
+        self.instring = first == '"'
+        self.escaped = False
+        parts: List[str] = []
+        start = self.pos + self.instring
+
+        while True:
+            end = self._scalarend(start) if scalar else self._valueend(start)
+            if end is not None:
+                break
+
+            if keep:
+                begin = self.pos
+                parts.append(self.buffer[begin:])
+            self.pos = len(self.buffer)
+            start = 0
+
+            if not self.fill():
+                if not scalar:
+                    raise ValueError("Unexpected end of JSON document")
+                end = len(self.buffer)
+                break
+
+        begin = self.pos
+        self.pos = end
+        if keep:
+            parts.append(self.buffer[begin:end])
+        return "".join(parts)
+
+    def _scalarend(self, pos: int) -> Optional[int]:
+        """End of the number or literal being scanned, None if not buffered"""
+        match = _SCALAR_END.search(self.buffer, pos)
+        return match.start() if match else None
+
+    def _valueend(self, pos: int) -> Optional[int]:
+        """End of the string, array, or object being scanned, None if not buffered"""
+        buffer = self.buffer
+
+        if self.escaped:
+            self.escaped = False
+            pos += 1
+
+        while True:
+            if self.instring:
+                match = _STRING_END.search(buffer, pos)
+                if match is None:
+                    return None
+
+                pos = match.end()
+                if match.group() == "\\":
+                    if pos == len(buffer):
+                        self.escaped = True
+                        return None
+                    pos += 1
+                    continue
+
+                self.instring = False
+
+            else:
+                match = _STRUCTURE.match(buffer, pos)
+                if match is None:
+                    return None
+
+                pos = match.end()
+                char = match.group(1)
+                if char == '"':
+                    self.instring = True
+                    continue
+
+                self.depth += 1 if char in "[{" else -1
+
+            if self.depth == 0:
+                return pos
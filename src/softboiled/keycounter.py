@@ -0,0 +1,151 @@
+"""
+In-memory tallies of the keys and objects seen by SoftBoiled classes
+
+Author: Preocts, discord: Preocts#8196
+"""
+import collections
+from typing import Any
+from typing import Counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from softboiled.registry import qualname
+
+Counts = Dict[str, Dict[str, Dict[str, int]]]
+KeyCount = Counter[Tuple[Type[Any], str]]
+
+
+class KeyCounter:
+    """Counts missing and extra keys per class and key name"""
+
+    def __init__(self) -> None:
+        """Create an empty counter"""
+        self.missing: KeyCount = collections.Counter()
+        self.extra: KeyCount = collections.Counter()
+        self._summarized: Tuple[KeyCount, KeyCount] = (
+            collections.Counter(),
+            collections.Counter(),
+        )
+
+    def count_missing(self, cls: Type[Any], name: str) -> int:
+        """Count a missing key, returns the total for that key of the class"""
+        key = (cls, name)
+        self.missing[key] += 1
+        return self.missing[key]
+
+    def count_extra(self, cls: Type[Any], names: Iterable[str]) -> None:
+        """Count each of the extra keys given to the class"""
+        self.extra.update((cls, name) for name in names)
+
+    def snapshot(self) -> Counts:
+        """
+        Returns the current counts as plain dicts
+
+        Shaped as {"missing": {class: {key: count}}, "extra": {...}}
+        """
+        return {
+            "missing": self._nest(self.missing),
+            "extra": self._nest(self.extra),
+        }
+
+    def summary(self) -> str:
+        """Describe the counts added since the previous summary, empty if none"""
+        missing = self.missing - self._summarized[0]
+        extra = self.extra - self._summarized[1]
+        self._summarized = (self.missing.copy(), self.extra.copy())
+
+        parts = [
+            f"{kind} {qualname(cls)}.{name}={count}"
+            for kind, counter in (("missing", missing), ("extra", extra))
+            for (cls, name), count in counter.items()
+        ]
+        return ", ".join(parts)
+
+    def reset(self) -> None:
+        """Clear all counts"""
+        self.missing.clear()
+        self.extra.clear()
+        self._summarized = (collections.Counter(), collections.Counter())
+
+    @staticmethod
+    def _nest(counter: KeyCount) -> Dict[str, Dict[str, int]]:
+        """Group counts by class name then key"""
+        nested: Dict[str, Dict[str, int]] = {}
+        for (cls, name), count in counter.items():
+            nested.setdefault(qualname(cls), {})[name] = count
+        return nested
+
+
+class DriftCounter:
+    """Counts instances, extra keys, missing keys, and nested builds per class"""
+
+    FIELDS = ("instances", "extra", "missing", "nested")
+
+    def __init__(self) -> None:
+        """Create an empty counter"""
+        self.counts: Dict[Type[Any], List[int]] = {}
+
+    def record(self, cls: Type[Any], extra: int, missing: int, nested: int) -> None:
+        """Add the counts of one instance of the class"""
+        counts = self.counts.get(cls)
+        if counts is None:
+            counts = self.counts[cls] = [0, 0, 0, 0]
+
+        counts[0] += 1
+        counts[1] += extra
+        counts[2] += missing
+        counts[3] += nested
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the current counts as plain dicts
+
+        Shaped as {class: {"instances": n, "extra": n, "missing": n, "nested": n}}
+        """
+        return {
+            qualname(cls): dict(zip(self.FIELDS, counts))
+            for cls, counts in self.counts.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all counts"""
+        self.counts.clear()
+
+
+class ValidationCounter:
+    """Counts sampled records and the fields failing their type check per class"""
+
+    def __init__(self) -> None:
+        """Create an empty counter"""
+        self.checked: Counter[Type[Any]] = collections.Counter()
+        self.mismatched: Dict[Type[Any], Counter[str]] = {}
+
+    def record(self, cls: Type[Any], mismatched: Iterable[str]) -> None:
+        """Add one checked record of the class and the names of failed fields"""
+        self.checked[cls] += 1
+
+        names = list(mismatched)
+        if names:
+            self.mismatched.setdefault(cls, collections.Counter()).update(names)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the current counts as plain dicts
+
+        Shaped as {class: {"checked": n, "mismatched": {field: n}}}
+        """
+        return {
+            qualname(cls): {
+                "checked": checked,
+                "mismatched": dict(self.mismatched.get(cls, {})),
+            }
+            for cls, checked in self.checked.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all counts"""
+        self.checked.clear()
+        self.mismatched.clear()
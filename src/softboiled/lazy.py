@@ -0,0 +1,81 @@
+"""
+Deferred construction of nested SoftBoiled objects
+
+Nested fields of a lazy class hold their raw key/value data until the
+attribute is first read. The nested object is then built and cached on
+the instance, so later reads cost the same as a normal attribute.
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
+
+class Deferred:
+    """Raw value of a nested field waiting to be built"""
+
+    __slots__ = ("builder", "value")
+
+    def __init__(self, builder: Callable[[Any], Any], value: Any) -> None:
+        """
+        Hold the raw value of a nested field
+
+        Args:
+            builder: Called with the raw value to build the field value
+            value: Raw value of the nested field
+        """
+        self.builder = builder
+        self.value = value
+
+    def resolve(self) -> Any:
+        """Build the value of the nested field"""
+        return self.builder(self.value)
+
+
+class LazyField:
+    """Data descriptor resolving a Deferred field value on first read"""
+
+    def __init__(self, name: str, default: Optional[Any] = None) -> None:
+        """
+        Args:
+            name: Name of the field
+            default: Value returned when read from the class itself
+        """
+        self.name = name
+        self.default = default
+
+    def __get__(self, obj: Any, objtype: Optional[Type[Any]] = None) -> Any:
+        if obj is None:
+            return self.default
+
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+        if isinstance(value, Deferred):
+            value = obj.__dict__[self.name] = value.resolve()
+
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+def install(cls: Type[Any], names: Iterable[str]) -> None:
+    """
+    Replace the named class attributes of a dataclass with LazyFields
+
+    Field defaults are kept by the dataclass `__init__`, the descriptor
+    only keeps the class attribute value for reads from the class.
+
+    Args:
+        cls: The raw dataclass
+        names: Names of the nested fields
+    """
+    for name in names:
+        if not isinstance(cls.__dict__.get(name), LazyField):
+            setattr(cls, name, LazyField(name, cls.__dict__.get(name)))
@@ -0,0 +1,169 @@
+"""
+Type driven builders for nested SoftBoiled fields
+
+A builder is compiled once per field from its resolved type hint. It
+converts the raw value of the field in a single pass, building nested
+SoftBoiled objects inside of lists, tuples, sets, dicts, and Optional
+wrappers of them. None, and any value not shaped like the container its
+hint names, passes through unchanged at every level.
+
+Author: Preocts, discord: Preocts#8196
+"""
+import collections.abc
+import functools
+import types
+import typing
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import Union
+
+Builder = Callable[[Any], Any]
+
+UNION_TYPES = {Union, getattr(types, "UnionType", Union)}
+
+# Container type origins mapped to the type created for them
+COLLECTIONS: Dict[Any, Callable[..., Any]] = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Iterable: list,
+    collections.abc.Collection: list,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Set: frozenset,
+    collections.abc.MutableSet: set,
+}
+
+# Values built element by element for collection and tuple hints
+SEQUENCES = (list, tuple, set, frozenset)
+
+MAPPINGS = {
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+}
+
+
+def make_builder(
+    hint: Any,
+    asmodel: Callable[[Any], Optional[Type[Any]]],
+    build: Callable[[Type[Any], Dict[str, Any]], Any],
+) -> Optional[Builder]:
+    """
+    Compile the builder of a type hint, None if it holds no nested models
+
+    Args:
+        hint: The resolved type hint of the field
+        asmodel: Returns the SoftBoiled class a hint names, else None
+        build: Called with a SoftBoiled class and its data to build one
+    """
+    model = asmodel(hint)
+    if model is not None:
+        return functools.partial(_build_model, build, model)
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+
+    def inner(arg: Any) -> Optional[Builder]:
+        return make_builder(arg, asmodel, build)
+
+    if origin in UNION_TYPES:
+        for arg in args:
+            builder = inner(arg)
+            if builder is not None:
+                return builder
+        return None
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            each = inner(args[0])
+            return functools.partial(_build_many, tuple, each) if each else None
+
+        builders = [inner(arg) for arg in args]
+        if not any(builders):
+            return None
+        return functools.partial(_build_tuple, [b or _unchanged for b in builders])
+
+    if origin in MAPPINGS and len(args) == 2:
+        each = inner(args[1])
+        return functools.partial(_build_mapping, each) if each else None
+
+    if origin in COLLECTIONS and args:
+        each = inner(args[0])
+        ctor = COLLECTIONS[origin]
+        return functools.partial(_build_many, ctor, each) if each else None
+
+    return None
+
+
+def count_models(builder: Builder, value: Any) -> int:
+    """
+    Count the nested models a builder creates from a value, without building
+
+    Args:
+        builder: A builder compiled by `make_builder`
+        value: The raw value of the field
+    """
+    if not isinstance(builder, functools.partial):
+        return 0
+
+    func, args = builder.func, builder.args
+
+    if func is _build_model:
+        if isinstance(value, dict):
+            return 1
+        if isinstance(value, list):
+            return sum(count_models(builder, val) for val in value)
+        return 0
+
+    if func is _build_many and isinstance(value, SEQUENCES):
+        return sum(count_models(args[1], val) for val in value)
+
+    if func is _build_tuple and isinstance(value, SEQUENCES):
+        return sum(count_models(b, val) for b, val in zip(args[0], value))
+
+    if func is _build_mapping and isinstance(value, dict):
+        return sum(count_models(args[0], val) for val in value.values())
+
+    return 0
+
+
+def _unchanged(value: Any) -> Any:
+    return value
+
+
+def _build_model(
+    build: Callable[[Type[Any], Dict[str, Any]], Any],
+    model: Type[Any],
+    value: Any,
+) -> Any:
+    """Build a dict into the model, each dict of a bare list, else unchanged"""
+    if isinstance(value, dict):
+        return build(model, value)
+
+    if isinstance(value, list):
+        return [_build_model(build, model, val) for val in value]
+
+    return value
+
+
+def _build_many(ctor: Callable[..., Any], each: Builder, value: Any) -> Any:
+    if not isinstance(value, SEQUENCES):
+        return value
+    return ctor([each(val) for val in value])
+
+
+def _build_tuple(builders: Sequence[Builder], value: Any) -> Any:
+    if not isinstance(value, SEQUENCES):
+        return value
+    return tuple(builder(val) for builder, val in zip(builders, value))
+
+
+def _build_mapping(each: Builder, value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return {key: each(val) for key, val in value.items()}
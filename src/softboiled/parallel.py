@@ -0,0 +1,185 @@
+"""
+Process pool loaders for very large batches of SoftBoiled records
+
+Input is split into shards which are built into instances by worker
+processes. Workers find the decorated class through the SoftBoiled
+registry by its qualified name, so models must be importable from
+their module (defined at module level).
+
+Author: Preocts, discord: Preocts#8196
+"""
+import collections
+import concurrent.futures
+import itertools
+import os
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from softboiled import jsonstream
+
+DEFAULT_CHUNKSIZE = 10_000
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def load_records(
+    model: Any,
+    records: Iterable[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Yield instances of model built from records by a pool of processes
+
+    Args:
+        model: The SoftBoiled decorated class
+        records: An iterable of key/value data, one dict per instance
+        max_workers: Number of worker processes, defaults to CPU count
+        chunksize: Number of records sent to a worker at a time
+        ordered: When False, yield shards as soon as any worker finishes
+    """
+    shards = _chunked(iter(records), chunksize)
+    tasks = ((_load_shard, model, shard) for shard in shards)
+
+    yield from _run(tasks, max_workers, ordered)
+
+
+def load_jsonlines(
+    model: Any,
+    path: str,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Yield instances of model from a JSON Lines file split by byte ranges
+
+    Each worker opens the file itself and reads only the lines that start
+    within its byte range, so records are never sent between processes.
+
+    Args:
+        model: The SoftBoiled decorated class
+        path: Path to the JSON Lines file
+        max_workers: Number of worker processes, defaults to CPU count
+        chunk_bytes: Approximate size of the byte range read by a worker
+        ordered: When False, yield shards as soon as any worker finishes
+    """
+    ranges = byte_ranges(os.path.getsize(path), chunk_bytes)
+    tasks = ((_load_range, model, path, start, end) for start, end in ranges)
+
+    yield from _run(tasks, max_workers, ordered)
+
+
+def byte_ranges(size: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """
+    Split `size` bytes into consecutive [start, end) ranges
+
+    Args:
+        size: Total number of bytes
+        chunk_bytes: Maximum size of each range
+    """
+    starts = range(0, size, chunk_bytes)
+    return [(start, min(start + chunk_bytes, size)) for start in starts]
+
+
+def read_range(path: str, start: int, end: int) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each decoded JSON line starting within the [start, end) byte range
+
+    Args:
+        path: Path to the JSON Lines file
+        start: First byte of the range
+        end: First byte after the range
+    """
+    with open(path, "rb") as infile:
+        position = start
+
+        # Skip the line that began in the previous range, if any
+        if start > 0:
+            infile.seek(start - 1)
+            position += len(infile.readline()) - 1
+
+        while position < end:
+            line = infile.readline()
+            if not line:
+                break
+
+            position += len(line)
+            if line.strip():
+                yield jsonstream.loads(line)
+
+
+def _run(
+    tasks: Iterator[Tuple[Any, ...]],
+    max_workers: Optional[int],
+    ordered: bool,
+) -> Iterator[Any]:
+    """Submit tasks keeping a bounded number in flight, yield their results"""
+    limit = (max_workers or os.cpu_count() or 1) * 2
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque["Future[List[Any]]"] = collections.deque()
+        running: Set["Future[List[Any]]"] = set()
+
+        for func, *args in tasks:
+            future = executor.submit(func, *args)
+            running.add(future)
+            if ordered:
+                pending.append(future)
+
+            if len(running) >= limit:
+                yield from _drain(pending, running, ordered, finish=False)
+
+        yield from _drain(pending, running, ordered, finish=True)
+
+
+def _drain(
+    pending: Deque["Future[List[Any]]"],
+    running: Set["Future[List[Any]]"],
+    ordered: bool,
+    finish: bool,
+) -> Iterator[Any]:
+    """Yield results of completed futures, waiting on at least one"""
+    while running:
+        if ordered:
+            future = pending.popleft()
+            running.discard(future)
+            yield from future.result()
+        else:
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                running.discard(future)
+                yield from future.result()
+
+        if not finish:
+            return
+
+
+def _chunked(records: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Any]]:
+    """Yield lists of at most `size` records"""
+    while True:
+        shard = list(itertools.islice(records, size))
+        if not shard:
+            return
+        yield shard
+
+
+def _load_shard(model: Any, shard: List[Dict[str, Any]]) -> List[Any]:
+    """Worker: build instances from a list of records"""
+    return model.load_many(shard)
+
+
+def _load_range(model: Any, path: str, start: int, end: int) -> List[Any]:
+    """Worker: build instances from the lines of a byte range"""
+    return model.load_many(read_range(path, start, end))
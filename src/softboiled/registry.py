@@ -0,0 +1,150 @@
+"""
+Registry of SoftBoiled classes keyed by fully qualified name
+
+Classes are registered under "module:QualName" so models sharing a
+class name in different modules never replace each other. Lookups by
+qualified name and by class are O(1) regardless of how many models are
+registered.
+
+Registration copies the indexes and publishes them as one immutable
+snapshot, serialized by a lock. Lookups read the current snapshot
+without locking, so classes may be registered from any thread while
+other threads build instances.
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+
+def qualname(cls: Type[Any]) -> str:
+    """Returns the "module:QualName" of a class"""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+    """Indexes of the registry, never changed once published"""
+
+    byname: Dict[str, Any]
+    byclass: Dict[Type[Any], Any]
+    byshortname: Dict[str, Tuple[str, ...]]
+
+
+class Registry(Mapping[str, Any]):
+    """Mapping of qualified name to registered SoftBoiled wrapper"""
+
+    def __init__(self) -> None:
+        """Create an empty registry"""
+        self._lock = threading.Lock()
+        self._snapshot = Snapshot({}, {}, {})
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """The current indexes, safe to read while classes are registered"""
+        return self._snapshot
+
+    def add(self, cls: Type[Any], wrapper: Any) -> None:
+        """
+        Register a class, replacing any class of the same qualified name
+
+        Args:
+            cls: The raw dataclass
+            wrapper: The SoftBoiled wrapper of the class
+        """
+        name = qualname(cls)
+
+        with self._lock:
+            current = self._snapshot
+            byname = {**current.byname, name: wrapper}
+            byclass = dict(current.byclass)
+            byshortname = current.byshortname
+
+            replaced = current.byname.get(name)
+            if replaced is not None:
+                byclass.pop(replaced.cls, None)
+            else:
+                byshortname = dict(byshortname)
+                # Hints name nested and function local classes by __name__
+                for short in dict.fromkeys((cls.__qualname__, cls.__name__)):
+                    byshortname[short] = byshortname.get(short, ()) + (name,)
+
+            byclass[cls] = wrapper
+            self._snapshot = Snapshot(byname, byclass, byshortname)
+
+    def forclass(self, cls: Any) -> Optional[Any]:
+        """
+        Returns the wrapper registered for a raw class, else None
+
+        Args:
+            cls: Any object, usually a resolved type hint
+        """
+        try:
+            return self._snapshot.byclass.get(cls)
+        except TypeError:  # Unhashable type hints
+            return None
+
+    def find(self, name: str, module: str = "") -> Optional[Any]:
+        """
+        Find a wrapper by class name as seen from within a module
+
+        A class of the module itself is preferred, then the class sharing
+        the longest package path with the module. Classes defined within a
+        function or another class are also found by their bare name.
+
+        Args:
+            name: The class name, or dotted qualified name, to find
+            module: The module the name is used in
+        """
+        snapshot = self._snapshot
+
+        found = snapshot.byname.get(f"{module}:{name}")
+        if found is not None:
+            return found
+
+        candidates = snapshot.byshortname.get(name)
+        if not candidates:
+            return None
+
+        best = max(candidates, key=lambda key: _shared(key.partition(":")[0], module))
+        return snapshot.byname[best]
+
+    def scope(self, namespace: str) -> Dict[str, Any]:
+        """
+        Returns the classes registered within a package or module
+
+        Args:
+            namespace: Dotted package or module name, e.g. "myapp.models"
+        """
+        prefix = namespace + "."
+        return {
+            key: wrapper
+            for key, wrapper in self._snapshot.byname.items()
+            if key.startswith(prefix) or key.partition(":")[0] == namespace
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        return self._snapshot.byname[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot.byname)
+
+    def __len__(self) -> int:
+        return len(self._snapshot.byname)
+
+
+def _shared(left: str, right: str) -> int:
+    """Count the leading dotted name parts two module names share"""
+    count = 0
+    for lpart, rpart in zip(left.split("."), right.split(".")):
+        if lpart != rpart:
+            break
+        count += 1
+    return count
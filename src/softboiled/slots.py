@@ -0,0 +1,56 @@
+"""
+Backport of `dataclass(slots=True)` for Python 3.8 and 3.9
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+from typing import Any
+from typing import cast
+from typing import List
+from typing import Type
+
+
+def add_slots(cls: Type[Any]) -> Type[Any]:
+    """
+    Returns a copy of a dataclass that stores its fields in `__slots__`
+
+    Follows what `dataclass(slots=True)` does on Python 3.10+. Classes that
+    already define `__slots__` are returned unchanged. As with the standard
+    library, methods using zero-argument `super()` are not supported.
+
+    Args:
+        cls: The dataclass to copy
+    """
+    if "__slots__" in cls.__dict__:
+        return cls
+
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+
+    # Field defaults live in __init__ and the fields, not as class attributes
+    for name in field_names:
+        cls_dict.pop(name, None)
+
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = field_names
+
+    if cls.__dataclass_params__.frozen:
+        cls_dict["__getstate__"] = _getstate
+        cls_dict["__setstate__"] = _setstate
+
+    metaclass = cast(Type[Any], type(cls))
+    slotted: Type[Any] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def _getstate(self: Any) -> List[Any]:
+    """Pickle state of a frozen slotted dataclass"""
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def _setstate(self: Any, state: List[Any]) -> None:
+    """Restore pickle state of a frozen slotted dataclass"""
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
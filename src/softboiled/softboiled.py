@@ -7,42 +7,645 @@ if messier, modeling of API responses that are lacking in firm schema.
 
 Author: Preocts, discord: Preocts#8196
 """
+import copyreg
 import dataclasses
 import functools
+import importlib
+import itertools
 import logging
 import re
+import time
+import typing
+from concurrent.futures import Executor
 from dataclasses import is_dataclass
 from dataclasses import MISSING
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
+from typing import Union
+
+from softboiled import asyncload
+from softboiled import codegen
+from softboiled import coercion
+from softboiled import jsonstream
+from softboiled import lazy
+from softboiled import nesting
+from softboiled import parallel
+from softboiled import registry
+from softboiled import serialize
+from softboiled import validation
+from softboiled.columns import Columns
+from softboiled.interning import InternTable
+from softboiled.keycounter import DriftCounter
+from softboiled.keycounter import KeyCounter
+from softboiled.keycounter import ValidationCounter
+from softboiled.registry import Registry
+from softboiled.slots import add_slots
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldPlan:
+    """Precompiled details of a single field of a SoftBoiled dataclass"""
+
+    name: str
+    default: Any
+    optional: bool
+    nested: Optional[Type[Any]]
+    factory: Optional[Callable[[], Any]] = None
+    intern: bool = False
+    aliases: Tuple[str, ...] = ()
+    builder: Optional[nesting.Builder] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+    converter: Optional[coercion.Converter] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+    checker: Optional[validation.Checker] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class ClassOptions:
+    """Options given to a SoftBoiled decorated class"""
+
+    slots: bool = False
+    lazy: bool = False
+    overflow: Optional[str] = None
+    coerce: bool = False
+    validate: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class ClassPlan:
+    """Precompiled, immutable cleaning plan of a SoftBoiled dataclass"""
+
+    cls: Type[Any]
+    expected: FrozenSet[str]
+    accepted: FrozenSet[str]
+    fields: Tuple[FieldPlan, ...]
+    nested: Tuple[FieldPlan, ...]
+    options: ClassOptions = ClassOptions()
+    interned: Tuple[str, ...] = ()
+    aliases: Tuple[Tuple[str, str], ...] = ()
+    checks: Tuple[Tuple[str, validation.Checker], ...] = ()
+    sampled: Iterator[int] = dataclasses.field(
+        default_factory=itertools.count, compare=False, repr=False
+    )
+    cleaner: Optional[codegen.Cleaner] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+    dumper: Optional[serialize.Dumper] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+
+
+WARNING_POLICIES = ("instance", "once", "summary", "off")
+
+_NULLABLE_NAMES = re.compile(r"\b(Optional|None|Any)\b")
+_IDENTIFIERS = re.compile(r"[A-Za-z_]\w*")
 
 
 class SoftBoiled:
     """Dataclass decorator that cleans creation parameters"""
 
     log = logging.getLogger("SoftBoiled")
+    warnings = "instance"
+    summaryinterval = 60.0
+    keycounts = KeyCounter()
+    instrument = False
+    drift = DriftCounter()
+    validations = ValidationCounter()
+    onmismatch: Optional[Callable[[Type[Any], str, Any], None]] = None
+    # Last class registered under each class name, kept for compatibility.
+    # Nested classes are resolved through the qualified name registry.
     platter: Dict[str, Any] = {}
+    registry = Registry()
+    plans: Dict[Type[Any], ClassPlan] = {}
+    classoptions: Dict[Type[Any], ClassOptions] = {}
+    codegen = False
+    interned = InternTable()
+
+    __lastsummary = time.monotonic()
+
+    def __init__(
+        self,
+        cls: Type[Any],
+        slots: bool = False,
+        lazy: bool = False,
+        overflow: Optional[str] = None,
+        coerce: bool = False,
+        validate: int = 0,
+    ) -> None:
+        """
+        Wraps a dataclasses.dataclass and registers class name internally
 
-    def __init__(self, cls: Type[Any]) -> None:
-        """Wraps a dataclasses.dataclass and registers class name internally"""
+        Args:
+            cls: The dataclass to decorate
+            slots: Store fields in `__slots__`, as `dataclass(slots=True)`
+            lazy: Build nested SoftBoiled fields on first attribute access
+            overflow: Name of a field that receives a dict of unknown keys
+            coerce: Convert values to the annotated type of their field
+            validate: Check one in this many records against the field
+                annotations, 0 to never check
+        """
         if not is_dataclass(cls):
             raise ValueError("Expected dataclass obejct, got %s", type(cls))
 
+        if slots and lazy:
+            raise ValueError("Lazy nested fields are not supported with slots")
+
+        if validate < 0:
+            raise ValueError(f"Validate must be 0 or more records, got {validate}")
+
+        names = {field.name for field in dataclasses.fields(cls)}
+        if overflow is not None and overflow not in names:
+            raise ValueError(f"Overflow field '{overflow}' is not a field of {cls}")
+
+        if slots:
+            cls = add_slots(cls)
+
         self.cls = cls
 
+        SoftBoiled.classoptions[cls] = ClassOptions(
+            slots, lazy, overflow, coerce, validate
+        )
+
         SoftBoiled.platter.update({cls.__name__: cls})
+        SoftBoiled.registry.add(cls, self)
+
+        copyreg.pickle(cls, SoftBoiled.__reduceinstance)
 
         functools.update_wrapper(self, cls)
 
+    @staticmethod
+    def options(
+        slots: bool = False,
+        lazy: bool = False,
+        overflow: Optional[str] = None,
+        coerce: bool = False,
+        validate: int = 0,
+    ) -> Callable[[Type[Any]], "SoftBoiled"]:
+        """
+        Returns a SoftBoiled decorator with options set
+
+        Example:
+            @SoftBoiled.options(slots=True)
+            @dataclasses.dataclass
+            class Model:
+                ...
+
+        Args:
+            slots: Store fields in `__slots__`, as `dataclass(slots=True)`
+            lazy: Build nested SoftBoiled fields on first attribute access
+            overflow: Name of a field that receives a dict of unknown keys,
+                values are held by reference
+            coerce: Convert values of int, float, bool, datetime, date, and
+                Enum fields given as another type, such as str
+            validate: Check one in this many records against the field
+                annotations, counted in `SoftBoiled.validations`
+        """
+        return functools.partial(
+            SoftBoiled,
+            slots=slots,
+            lazy=lazy,
+            overflow=overflow,
+            coerce=coerce,
+            validate=validate,
+        )
+
     def __call__(self__, *args: Any, **kwargs: Any) -> Any:
         """Handles cleaning kwargs before creating dataclass"""
-        return self__.cls(*args, **SoftBoiled.cleandata(self__.cls, kwargs))
+        plan = SoftBoiled.getplan(self__.cls)
+        return self__.cls(*args, **SoftBoiled.__applyplan(plan, kwargs))
+
+    @property
+    def plan(self) -> ClassPlan:
+        """The compiled cleaning plan of the decorated class"""
+        return SoftBoiled.getplan(self.cls)
+
+    def load_many(self, records: Iterable[Dict[str, Any]]) -> List[Any]:
+        """
+        Create an instance from each dict of key/value data in records
+
+        Equivalent to `[Model(**record) for record in records]` without the
+        per-record wrapper call and kwargs repacking.
+
+        Args:
+            records: An iterable of key/value data, one dict per instance
+        """
+        plan = self.plan
+        cls = plan.cls
+        applyplan = SoftBoiled.__applyplan
+
+        return [cls(**applyplan(plan, record)) for record in records]
+
+    def load_columns(self, records: Iterable[Dict[str, Any]]) -> Columns:
+        """
+        Create a column oriented batch from each dict of key/value data
+
+        Records are cleaned as usual then stored as one list per field.
+        Instances are only created when a row of the batch is accessed.
+
+        Args:
+            records: An iterable of key/value data, one dict per record
+        """
+        plan = self.plan
+        applyplan = SoftBoiled.__applyplan
+        names = [field.name for field in plan.fields]
+
+        return Columns.from_rows(
+            plan.cls, names, (applyplan(plan, record) for record in records)
+        )
+
+    def iter_load(self, fileobj: IO[Any], key: Optional[str] = None) -> Iterator[Any]:
+        """
+        Yield an instance for each record streamed from a file object
+
+        Records are read one at a time so memory use is bounded regardless
+        of file size. Reads JSON Lines unless `key` is given, in which case
+        the records are the array under that key of a top-level JSON object.
+
+        Args:
+            fileobj: Text or binary file object to read records from
+            key: Top-level key of the array of records, e.g. "users"
+        """
+        plan = self.plan
+        cls = plan.cls
+        applyplan = SoftBoiled.__applyplan
+
+        if key is None:
+            records = jsonstream.iter_jsonlines(fileobj)
+        else:
+            records = jsonstream.iter_array(fileobj, key)
+
+        for record in records:
+            yield cls(**applyplan(plan, record))
+
+    def from_json(self, data: Union[str, bytes]) -> Any:
+        """
+        Create an instance from a JSON object, or a list from a JSON array
+
+        The document is decoded with orjson when installed, else with the
+        json module, and cleaned directly without kwargs repacking.
+
+        Args:
+            data: JSON document as str or bytes
+        """
+        plan = self.plan
+        cls = plan.cls
+        applyplan = SoftBoiled.__applyplan
+        decoded = jsonstream.loads(data)
+
+        if isinstance(decoded, dict):
+            return cls(**applyplan(plan, decoded))
+
+        if isinstance(decoded, list):
+            return [cls(**applyplan(plan, record)) for record in decoded]
+
+        raise ValueError(f"Expected a JSON object or array, got {type(decoded)}")
+
+    def load_parallel(
+        self,
+        records: Iterable[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        chunksize: int = parallel.DEFAULT_CHUNKSIZE,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Yield instances built from records by a pool of worker processes
+
+        Records are sent to workers in shards of `chunksize`. The class is
+        found in each worker by its qualified name so it must be defined at
+        the module level. Results are yielded in input order unless
+        `ordered` is False, then shards are yielded as they finish.
+
+        Args:
+            records: An iterable of key/value data, one dict per instance
+            max_workers: Number of worker processes, defaults to CPU count
+            chunksize: Number of records sent to a worker at a time
+            ordered: Yield in input order, otherwise in order of completion
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+        return parallel.load_records(self, records, max_workers, chunksize, ordered)
+
+    def load_parallel_jsonl(
+        self,
+        path: str,
+        max_workers: Optional[int] = None,
+        chunk_bytes: int = parallel.DEFAULT_CHUNK_BYTES,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Yield instances from a JSON Lines file split across worker processes
+
+        Each worker reads the lines of its own byte range of the file.
+
+        Args:
+            path: Path to the JSON Lines file
+            max_workers: Number of worker processes, defaults to CPU count
+            chunk_bytes: Approximate size of the byte range read by a worker
+            ordered: Yield in file order, otherwise in order of completion
+        """
+        if chunk_bytes < 1:
+            raise ValueError(f"chunk_bytes must be at least 1, got {chunk_bytes}")
+
+        return parallel.load_jsonlines(self, path, max_workers, chunk_bytes, ordered)
+
+    def to_dict(self, obj: Any, omit_none: bool = False) -> Dict[str, Any]:
+        """
+        Returns the fields of an instance as a new dict
+
+        Nested SoftBoiled objects are converted to dicts, other values are
+        not copied. Faster than `dataclasses.asdict` for the same result.
+
+        Args:
+            obj: An instance of the decorated class
+            omit_none: Leave out fields, at every level, holding None
+        """
+        return self.plan.dumper(obj, omit_none)  # type: ignore[misc]
+
+    def to_json(self, obj: Any, omit_none: bool = False) -> str:
+        """
+        Returns an instance as a JSON document
+
+        Encoded the same with orjson, when installed, or the json module.
+        Raises TypeError or ValueError for values JSON cannot hold.
+
+        Args:
+            obj: An instance of the decorated class
+            omit_none: Leave out fields, at every level, holding None
+        """
+        return serialize.dumps(self.to_dict(obj, omit_none))
+
+    def load_async(
+        self,
+        source: AsyncIterable[asyncload.Record],
+        batch_size: int = asyncload.DEFAULT_BATCH_SIZE,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Asynchronously yield an instance for each record of an async source
+
+        Records are built in batches by an executor, the loop default thread
+        pool unless given, so the event loop is not blocked. A process pool
+        may be given when the class is defined at the module level.
+
+        Example:
+            async for user in PagerdutyUser.load_async(fetch_pages()):
+                ...
+
+        Args:
+            source: Async iterable of dicts, or JSON object lines as str or bytes
+            batch_size: Number of records built in the executor at a time
+            executor: Executor to build batches in
+        """
+        return asyncload.load_records(self, source, batch_size, executor)
 
     def __repr__(self) -> str:
         """Identify has the decorated class"""
         return repr(self.cls)
 
+    def __or__(self, other: Any) -> Any:
+        """Support `Model | None` style type hints on the decorated class"""
+        return Union[self.cls, other]
+
+    def __ror__(self, other: Any) -> Any:
+        """Support `None | Model` style type hints on the decorated class"""
+        return Union[other, self.cls]
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        """Pickle by qualified name, resolved through the registry on load"""
+        return SoftBoiled.resolve, (SoftBoiled.qualname(self.cls),)
+
+    @staticmethod
+    def qualname(obj: Type[Any]) -> str:
+        """
+        Returns the stable qualified name of a class, "module:QualName"
+
+        Args:
+            obj: The class object that has been decorated
+        """
+        return registry.qualname(obj)
+
+    @staticmethod
+    def resolve(qualname: str) -> "SoftBoiled":
+        """
+        Find a registered SoftBoiled class by qualified name
+
+        The module is imported when the class is not yet registered, as
+        happens in a fresh worker process. Raises KeyError if not found.
+
+        Args:
+            qualname: Qualified name as returned by `SoftBoiled.qualname`
+        """
+        if qualname not in SoftBoiled.registry:
+            importlib.import_module(qualname.partition(":")[0])
+
+        return SoftBoiled.registry[qualname]
+
+    @staticmethod
+    def __reduceinstance(obj: Any) -> Tuple[Any, ...]:
+        """
+        Pickle instances of a decorated class through the registry
+
+        The module attribute named for the class is the SoftBoiled wrapper,
+        so the default pickling of the raw dataclass cannot find it.
+        """
+        if SoftBoiled.getplan(type(obj)).options.lazy:
+            for field in dataclasses.fields(obj):
+                getattr(obj, field.name)
+
+        reduced = object.__reduce_ex__(obj, 2)
+        assert isinstance(reduced, tuple)  # Protocol 2 always reduces to a tuple
+        return SoftBoiled.restore, (SoftBoiled.qualname(type(obj)),), reduced[2]
+
+    @staticmethod
+    def restore(qualname: str) -> Any:
+        """
+        Create an empty instance of a registered class, used by unpickling
+
+        Args:
+            qualname: Qualified name as returned by `SoftBoiled.qualname`
+        """
+        cls: Any = SoftBoiled.resolve(qualname).cls
+        return cls.__new__(cls)
+
+    @staticmethod
+    def setwarnings(policy: str, summaryinterval: Optional[float] = None) -> None:
+        """
+        Set how missing required keys are reported
+
+        Missing and extra keys are tallied in `SoftBoiled.keycounts` under
+        every policy except "off".
+
+        Policies:
+            instance: Log a warning every time a required key is missing
+            once: Log a warning the first time a class is missing a key
+            summary: Log counts since the last summary, at most once per interval
+            off: No warnings and no counting
+
+        Args:
+            policy: One of "instance", "once", "summary", or "off"
+            summaryinterval: Seconds between summaries, unchanged if None
+        """
+        if policy not in WARNING_POLICIES:
+            raise ValueError(f"Expected one of {WARNING_POLICIES}, got {policy!r}")
+
+        SoftBoiled.warnings = policy
+        if summaryinterval is not None:
+            SoftBoiled.summaryinterval = summaryinterval
+
+    @staticmethod
+    def logsummary() -> None:
+        """Log the missing and extra key counts since the last summary"""
+        SoftBoiled.__lastsummary = time.monotonic()
+        summary = SoftBoiled.keycounts.summary()
+
+        if summary:
+            SoftBoiled.log.warning("Type Warning: key summary, %s", summary)
+
+    @staticmethod
+    def getplan(obj: Type[Any]) -> ClassPlan:
+        """
+        Returns the cleaning plan of the object, compiling it on first request
+
+        Compiling is deferred until first use so forward references to
+        SoftBoiled classes defined later in a module can be resolved. Plans
+        are compiled for the `SoftBoiled.codegen` mode in effect at that
+        time, clear `SoftBoiled.plans` after changing the mode.
+
+        Args:
+            obj: The class object that has been decorated
+        """
+        plan = SoftBoiled.plans.get(obj)
+        if plan is None:
+            plan = SoftBoiled.plans[obj] = SoftBoiled.compileplan(obj)
+        return plan
+
+    @staticmethod
+    def compileplan(obj: Type[Any]) -> ClassPlan:
+        """
+        Builds the cleaning plan of an object, does not cache the result
+
+        Args:
+            obj: The class object that has been decorated
+        """
+        try:
+            hints = typing.get_type_hints(obj)
+        except (NameError, TypeError) as err:
+            SoftBoiled.log.debug("Unresolved type hints on %s: %s", obj, err)
+            hints = {}
+
+        options = SoftBoiled.classoptions.get(obj, ClassOptions())
+
+        fields = tuple(
+            SoftBoiled.__planfield(
+                field, hints.get(field.name, field.type), obj.__module__, options
+            )
+            for field in dataclasses.fields(obj)
+        )
+
+        expected = frozenset(field.name for field in fields)
+        nested = tuple(field for field in fields if field.nested is not None)
+        interned = tuple(f.name for f in fields if f.intern and not f.builder)
+        aliases = tuple((alias, f.name) for f in fields for alias in f.aliases)
+        checks = tuple((f.name, f.checker) for f in fields if f.checker is not None)
+
+        if options.lazy:
+            lazy.install(obj, (field.name for field in nested))
+
+        cleaner = None
+        if SoftBoiled.codegen:
+            cleaner = codegen.make_cleaner(
+                obj,
+                fields,
+                SoftBoiled.__warnmissing,
+                lazy.Deferred if options.lazy else None,
+                options.overflow,
+                SoftBoiled.interned.intern,
+            )
+
+        return ClassPlan(
+            cls=obj,
+            expected=expected,
+            accepted=expected.union(alias for alias, _ in aliases),
+            fields=fields,
+            nested=nested,
+            options=options,
+            interned=interned,
+            aliases=aliases,
+            checks=checks,
+            cleaner=cleaner,
+            dumper=serialize.make_dumper(obj, fields, SoftBoiled.__dumpvalue),
+        )
+
+    @staticmethod
+    def __planfield(
+        field: "dataclasses.Field[Any]",
+        hint: Any,
+        module: str,
+        options: ClassOptions,
+    ) -> FieldPlan:
+        """
+        Compile the plan of a single field from its resolved type hint
+
+        Args:
+            field: The dataclass field
+            hint: The resolved type hint of the field
+            module: Module of the class the field belongs to
+            options: Options of the class the field belongs to
+        """
+        asmodel = functools.partial(SoftBoiled.__asmodel, module=module)
+        builder = nesting.make_builder(hint, asmodel, SoftBoiled.__buildnested)
+
+        if builder is not None and "coerce" in field.metadata:
+            raise ValueError(
+                f"Field '{field.name}' holds nested SoftBoiled objects, "
+                "which cannot be given a coerce converter"
+            )
+
+        converter = None
+        if builder is None and (options.coerce or "coerce" in field.metadata):
+            converter = coercion.make_converter(hint, field.metadata.get("coerce"))
+
+        checker = None
+        if options.validate:
+            checker = validation.make_checker(hint, asmodel)
+
+        return FieldPlan(
+            name=field.name,
+            default=field.default if field.default is not MISSING else None,
+            optional=SoftBoiled.__isoptional(hint),
+            nested=SoftBoiled.__findnested(hint, module) if builder else None,
+            factory=(
+                field.default_factory if field.default_factory is not MISSING else None
+            ),
+            intern=bool(field.metadata.get("intern")),
+            aliases=SoftBoiled.__aliases(field),
+            builder=builder,
+            converter=converter,
+            checker=checker,
+        )
+
+    @staticmethod
+    def __aliases(field: "dataclasses.Field[Any]") -> Tuple[str, ...]:
+        """Returns the aliases of a field from its `alias` metadata"""
+        alias = field.metadata.get("alias", ())
+        return (alias,) if isinstance(alias, str) else tuple(alias)
+
     @staticmethod
     def cleandata(obj: Type[Any], data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,75 +655,356 @@ class SoftBoiled:
             obj: The class object that has been decorated
             data: kwargs of the creation call for the decorated class
         """
+        return SoftBoiled.__applyplan(SoftBoiled.getplan(obj), data)
 
-        expected = [field.name for field in dataclasses.fields(obj)]
+    @staticmethod
+    def __build(plan: ClassPlan, data: Dict[str, Any]) -> Any:
+        """
+        Create an instance of the raw dataclass, cleaning data exactly once
 
-        cleandata = {key: value for key, value in data.items() if key in expected}
+        The raw class is called directly rather than the SoftBoiled wrapper
+        so the data is not run through the cleaning steps a second time.
 
-        nesteddata = SoftBoiled.__createnested(obj, cleandata)
+        Args:
+            plan: The compiled plan of the decorated class
+            data: key/value data of the nested object
+        """
+        return plan.cls(**SoftBoiled.__applyplan(plan, data))
 
-        fulldata = SoftBoiled.__addmissing(obj, nesteddata)
+    @staticmethod
+    def __buildnested(obj: Type[Any], data: Dict[str, Any]) -> Any:
+        """
+        Create an instance of a nested raw dataclass from its key/value data
 
-        return fulldata
+        Args:
+            obj: The raw nested dataclass
+            data: key/value data of the nested object
+        """
+        return SoftBoiled.__build(SoftBoiled.getplan(obj), data)
 
     @staticmethod
-    def __addmissing(obj: Type[Any], data: Dict[str, Any]) -> Dict[str, Any]:
+    def __applyplan(plan: ClassPlan, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Filters, nests, and fills data following a compiled plan
+
+        Args:
+            plan: The compiled plan of the decorated class
+            data: kwargs of the creation call for the decorated class
+        """
+        expected = plan.expected
+
+        if SoftBoiled.warnings != "off" and not plan.accepted.issuperset(data):
+            SoftBoiled.keycounts.count_extra(plan.cls, data.keys() - plan.accepted)
+            if SoftBoiled.warnings == "summary":
+                SoftBoiled.__duesummary()
+
+        if SoftBoiled.instrument:
+            SoftBoiled.__recorddrift(plan, data)
+
+        if plan.cleaner is not None:
+            cleandata = plan.cleaner(data)
+
+        else:
+            cleandata = {key: value for key, value in data.items() if key in expected}
+
+            if plan.aliases:
+                SoftBoiled.__addaliased(plan, data, cleandata)
+
+            SoftBoiled.__createnested(plan, cleandata)
+
+            if plan.options.overflow is not None:
+                SoftBoiled.__addoverflow(plan, data, cleandata)
+
+            cleandata = SoftBoiled.__addmissing(plan, cleandata)
+
+            if plan.interned:
+                SoftBoiled.__internvalues(plan, cleandata)
+
+        if plan.checks and next(plan.sampled) % plan.options.validate == 0:
+            SoftBoiled.__validate(plan, cleandata)
+
+        return cleandata
+
+    @staticmethod
+    def __validate(plan: ClassPlan, cleandata: Dict[str, Any]) -> None:
+        """
+        Check cleaned values against their field annotations
+
+        Failed fields are counted in `SoftBoiled.validations` and passed to
+        `SoftBoiled.onmismatch` when set. Lazy fields not yet built are
+        not checked.
+
+        Args:
+            plan: The compiled plan of the decorated class
+            cleandata: Cleaned kwargs of the decorated class
+        """
+        mismatched: List[str] = []
+        onmismatch = SoftBoiled.onmismatch
+
+        for name, check in plan.checks:
+            value = cleandata[name]
+            if check(value) or isinstance(value, lazy.Deferred):
+                continue
+
+            mismatched.append(name)
+            if onmismatch is not None:
+                onmismatch(plan.cls, name, value)
+
+        SoftBoiled.validations.record(plan.cls, mismatched)
+
+    @staticmethod
+    def __addaliased(
+        plan: ClassPlan,
+        data: Dict[str, Any],
+        cleandata: Dict[str, Any],
+    ) -> None:
+        """
+        Add values given under an alias of a field missing from cleandata
+
+        The field name takes precedence, then aliases in declared order.
+
+        Args:
+            plan: The compiled plan of the decorated class
+            data: kwargs of the creation call for the decorated class
+            cleandata: Filtered kwargs, updated in place
+        """
+        for alias, name in plan.aliases:
+            if name not in cleandata and alias in data:
+                cleandata[name] = data[alias]
+
+    @staticmethod
+    def __internvalues(plan: ClassPlan, cleandata: Dict[str, Any]) -> None:
+        """Share the string values of interned fields, updated in place"""
+        intern = SoftBoiled.interned.intern
+
+        for name in plan.interned:
+            if name in cleandata:
+                cleandata[name] = intern(cleandata[name])
+
+    @staticmethod
+    def __addoverflow(
+        plan: ClassPlan,
+        data: Dict[str, Any],
+        cleandata: Dict[str, Any],
+    ) -> None:
+        """
+        Place the unknown keys of data into the overflow field of cleandata
+
+        Unknown keys are merged over a dict given for the overflow field. Any
+        other value given for the field is kept in the dict under its name.
+
+        Args:
+            plan: The compiled plan of the decorated class
+            data: kwargs of the creation call for the decorated class
+            cleandata: Filtered kwargs, updated in place
+        """
+        name = plan.options.overflow
+        if name is None:
+            return
+
+        accepted = plan.accepted
+        extra = {key: value for key, value in data.items() if key not in accepted}
+
+        if extra:
+            given = cleandata.get(name)
+            if isinstance(given, dict):
+                cleandata[name] = {**given, **extra}
+            elif given is not None:
+                cleandata[name] = {name: given, **extra}
+            else:
+                cleandata[name] = extra
+
+    @staticmethod
+    def __recorddrift(plan: ClassPlan, data: Dict[str, Any]) -> None:
+        """
+        Record extra keys, missing keys, and nested objects of one instance
+
+        Args:
+            plan: The compiled plan of the decorated class
+            data: kwargs of the creation call for the decorated class
+        """
+        present = len(plan.accepted.intersection(data))
+        nested = 0
+
+        for field in plan.nested:
+            for key in (field.name,) + field.aliases:
+                if key in data:
+                    if field.builder is not None:
+                        nested += nesting.count_models(field.builder, data[key])
+                    break
+
+        SoftBoiled.drift.record(
+            plan.cls,
+            extra=len(data) - present,
+            missing=max(len(plan.expected) - present, 0),
+            nested=nested,
+        )
+
+    @staticmethod
+    def __addmissing(plan: ClassPlan, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Adds missing key/values as None. Warning to console if not optional
 
+        Values of fields with a converter are converted in the same pass.
+
         Args:
-            obj: The class object that has been decorated
+            plan: The compiled plan of the decorated class
             data: kwargs of the creation call for the decorated class
         """
         return_data: Dict[str, Any] = {}
 
-        for field in dataclasses.fields(obj):
+        for field in plan.fields:
 
-            if field.name in data:
-                new_value = data[field.name]
-            else:
-                new_value = field.default if field.default is not MISSING else None
+            new_value = data.get(field.name, MISSING)
+
+            if new_value is MISSING:
+                factory = field.factory
+                new_value = factory() if factory is not None else field.default
 
-            return_data.update({field.name: new_value})
+            elif field.converter is not None:
+                new_value = field.converter(new_value)
 
-            if new_value is None and "Optional" not in str(field.type):
-                SoftBoiled.log.warning(
-                    "Type Warning: required key missing, now None '%s'", field.name
-                )
+            return_data[field.name] = new_value
+
+            if new_value is None and not field.optional:
+                SoftBoiled.__warnmissing(plan.cls, field.name)
 
         return return_data
 
     @staticmethod
-    def __createnested(obj: Type[Any], data: Dict[str, Any]) -> Dict[str, Any]:
+    def __warnmissing(obj: Type[Any], name: str) -> None:
         """
-        Create nested dataclass objects with sbload calls
+        Warn that a required field is missing and has been set to None
 
         Args:
             obj: The class object that has been decorated
+            name: Name of the missing field
+        """
+        policy = SoftBoiled.warnings
+
+        if policy == "off":
+            return
+
+        count = SoftBoiled.keycounts.count_missing(obj, name)
+
+        if policy == "instance" or (policy == "once" and count == 1):
+            SoftBoiled.log.warning(
+                "Type Warning: required key missing, now None '%s'", name
+            )
+
+        elif policy == "summary":
+            SoftBoiled.__duesummary()
+
+    @staticmethod
+    def __duesummary() -> None:
+        """Log a key summary if the summary interval has passed"""
+        elapsed = time.monotonic() - SoftBoiled.__lastsummary
+
+        if elapsed >= SoftBoiled.summaryinterval:
+            SoftBoiled.logsummary()
+
+    @staticmethod
+    def __createnested(plan: ClassPlan, data: Dict[str, Any]) -> None:
+        """
+        Create nested dataclass objects in place from their key/value data
+
+        Args:
+            plan: The compiled plan of the decorated class
             data: kwargs of the creation call for the decorated class
         """
+        for field in plan.nested:
 
-        return_data: Dict[str, Any] = {}
-        fields = {field.name: field for field in dataclasses.fields(obj)}
+            if field.name not in data:
+                continue
+
+            builder: Any = field.builder
+
+            if plan.options.lazy:
+                data[field.name] = lazy.Deferred(builder, data[field.name])
+            else:
+                data[field.name] = builder(data[field.name])
+
+    @staticmethod
+    def __dumpvalue(value: Any, omit_none: bool) -> Any:
+        """Convert the nested SoftBoiled objects of a field value to dicts"""
+        return serialize.dump_value(value, omit_none, SoftBoiled.__dumperfor)
+
+    @staticmethod
+    def __dumperfor(cls: Type[Any]) -> Optional[serialize.Dumper]:
+        """Returns the serializer of a registered class, else None"""
+        if SoftBoiled.registry.forclass(cls) is None:
+            return None
+        return SoftBoiled.getplan(cls).dumper
 
-        for key, value in data.items():
+    @staticmethod
+    def __isoptional(hint: Any) -> bool:
+        """
+        Returns True if a type hint accepts None, such as Optional or Any
 
-            finaldata: Any = value
+        Handles Optional[X], Union[X, None], X | None, and Any. Hints that
+        could not be resolved are checked by name.
 
-            for softboiled in SoftBoiled.platter:
-                # Find the SoftBoiled class name in the type string
-                match = re.findall(rf"\b{softboiled}\b", str(fields[key].type))
+        Args:
+            hint: The resolved type hint of the field
+        """
+        if hint is Any or hint is None or hint is type(None):
+            return True
 
-                if match:
+        if isinstance(hint, typing.ForwardRef):
+            hint = hint.__forward_arg__
 
-                    constr = SoftBoiled.platter[match[0]]
+        if isinstance(hint, str):
+            return bool(_NULLABLE_NAMES.search(hint))
 
-                    if isinstance(value, list):
-                        cleandata = [SoftBoiled.cleandata(constr, val) for val in value]
-                        finaldata = [constr(**inner) for inner in cleandata]
-                    else:
-                        finaldata = constr(**SoftBoiled.cleandata(constr, value))
+        if typing.get_origin(hint) in nesting.UNION_TYPES:
+            return any(SoftBoiled.__isoptional(arg) for arg in typing.get_args(hint))
 
-            return_data.update({key: finaldata})
+        return False
 
-        return return_data
+    @staticmethod
+    def __asmodel(hint: Any, module: str = "") -> Optional[Type[Any]]:
+        """
+        Returns the registered SoftBoiled class a type hint names, else None
+
+        Hints that could not be resolved are searched by name, preferring
+        classes registered closest to the module using the hint.
+
+        Args:
+            hint: The resolved type hint of the field
+            module: Module of the class using the hint
+        """
+        if isinstance(hint, SoftBoiled):
+            return hint.cls
+
+        if isinstance(hint, typing.ForwardRef):
+            hint = hint.__forward_arg__
+
+        if isinstance(hint, str):
+            for name in _IDENTIFIERS.findall(hint):
+                found = SoftBoiled.registry.find(name, module)
+                if found is not None:
+                    return found.cls
+            return None
+
+        wrapper = SoftBoiled.registry.forclass(hint)
+        return wrapper.cls if wrapper is not None else None
+
+    @staticmethod
+    def __findnested(hint: Any, module: str = "") -> Optional[Type[Any]]:
+        """
+        Find the registered SoftBoiled class within a resolved type hint
+
+        Args:
+            hint: The resolved type hint of the field
+            module: Module of the class using the hint
+        """
+        found = SoftBoiled.__asmodel(hint, module)
+        if found is not None:
+            return found
+
+        for arg in typing.get_args(hint):
+            found = SoftBoiled.__findnested(arg, module)
+            if found is not None:
+                return found
+
+        return None
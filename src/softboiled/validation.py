@@ -0,0 +1,132 @@
+"""
+Type checks compiled per field from resolved type hints
+
+A checker is compiled once per field and returns whether a cleaned value
+matches the annotation of the field. Containers are checked element by
+element, nested SoftBoiled fields by the class of the built object.
+Hints that cannot be checked at runtime, such as TypeVars and forward
+references that never resolved, accept every value.
+
+Author: Preocts, discord: Preocts#8196
+"""
+import functools
+import typing
+from typing import Any
+from typing import Callable
+from typing import ForwardRef
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+from softboiled import nesting
+
+Checker = Callable[[Any], bool]
+
+LITERAL = getattr(typing, "Literal", None)
+
+
+def make_checker(
+    hint: Any,
+    asmodel: Callable[[Any], Optional[Type[Any]]],
+) -> Checker:
+    """
+    Compile the checker of a type hint
+
+    Args:
+        hint: The resolved type hint of the field
+        asmodel: Returns the SoftBoiled class a hint names, else None
+    """
+    model = asmodel(hint)
+    if model is not None:
+        return functools.partial(_instance, model)
+
+    if hint is Any or isinstance(hint, (str, ForwardRef, TypeVar)):
+        return _anything
+
+    if hint is None or hint is type(None):
+        return _none
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+
+    def inner(arg: Any) -> Checker:
+        return make_checker(arg, asmodel)
+
+    if origin in nesting.UNION_TYPES:
+        return functools.partial(_anyof, [inner(arg) for arg in args])
+
+    if origin is not None and origin is LITERAL:
+        return functools.partial(_literal, args)
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return functools.partial(_many, tuple, inner(args[0]))
+        return functools.partial(_tuple, [inner(arg) for arg in args])
+
+    if origin in nesting.MAPPINGS and len(args) == 2:
+        return functools.partial(_mapping, origin, inner(args[0]), inner(args[1]))
+
+    if origin in nesting.COLLECTIONS and args:
+        return functools.partial(_many, origin, inner(args[0]))
+
+    if isinstance(origin, type):
+        return functools.partial(_instance, origin)
+
+    if hint is float:
+        return _float
+
+    if hint is int:
+        return _int
+
+    if isinstance(hint, type):
+        return functools.partial(_instance, hint)
+
+    return _anything
+
+
+def _anything(value: Any) -> bool:
+    return True
+
+
+def _none(value: Any) -> bool:
+    return value is None
+
+
+def _int(value: Any) -> bool:
+    """bool is a subclass of int but is reported as a mismatch"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _float(value: Any) -> bool:
+    """int is accepted where float is expected, as by type checkers"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _instance(cls: Type[Any], value: Any) -> bool:
+    return isinstance(value, cls)
+
+
+def _anyof(checkers: Sequence[Checker], value: Any) -> bool:
+    return any(check(value) for check in checkers)
+
+
+def _literal(allowed: Tuple[Any, ...], value: Any) -> bool:
+    return value in allowed
+
+
+def _many(ctor: Type[Any], each: Checker, value: Any) -> bool:
+    return isinstance(value, ctor) and all(each(val) for val in value)
+
+
+def _tuple(checkers: Sequence[Checker], value: Any) -> bool:
+    if not isinstance(value, tuple) or len(value) != len(checkers):
+        return False
+    return all(check(val) for check, val in zip(checkers, value))
+
+
+def _mapping(ctor: Type[Any], key: Checker, each: Checker, value: Any) -> bool:
+    if not isinstance(value, ctor):
+        return False
+    return all(key(k) and each(v) for k, v in value.items())
@@ -0,0 +1,111 @@
+"""
+Tests for ./softboiled/asyncload.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import asyncio
+import dataclasses
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+from softboiled import asyncload
+from softboiled import SoftBoiled
+
+RECORDS: List[Dict[str, Any]] = [
+    {"id": idx, "name": f"name {idx}", "extra": idx, "inner": {"id": idx}}
+    for idx in range(25)
+]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class AsyncInner:
+    id: int
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class AsyncModel:
+    id: int
+    name: Optional[str]
+    inner: AsyncInner
+
+
+async def _pages(records: List[Any], page_size: int = 7) -> AsyncIterator[Any]:
+    """Stand-in for a paginated API client yielding one record at a time"""
+    for start in range(0, len(records), page_size):
+        end = start + page_size
+        await asyncio.sleep(0)
+        for record in records[start:end]:
+            yield record
+
+
+def _collect(source: AsyncIterator[Any], **kwargs: Any) -> List[Any]:
+    async def collect() -> List[Any]:
+        return [instance async for instance in AsyncModel.load_async(source, **kwargs)]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("batch_size", [1, 4, 25, 100])
+def test_load_async_in_order(batch_size: int) -> None:
+    """Pass/fail"""
+    result = _collect(_pages(RECORDS), batch_size=batch_size)
+
+    assert result == AsyncModel.load_many(RECORDS)
+
+
+def test_load_async_json_lines() -> None:
+    """Pass/fail"""
+    lines = [json.dumps(record) for record in RECORDS[:10]]
+    lines[1::2] = [line.encode() for line in lines[1::2]]
+
+    result = _collect(_pages(lines), batch_size=3)
+
+    assert result == AsyncModel.load_many(RECORDS[:10])
+
+
+def test_load_async_empty_source() -> None:
+    """Pass/fail"""
+    assert _collect(_pages([])) == []
+
+
+def test_load_async_builds_off_the_loop(monkeypatch: Any) -> None:
+    """Batches are built in the given executor, not the event loop thread"""
+    threads = set()
+    loop_thread = threading.get_ident()
+
+    async def source() -> AsyncIterator[Any]:
+        for record in RECORDS:
+            threads.add(("source", threading.get_ident()))
+            yield record
+
+    original = asyncload._load_batch
+
+    def spy(model: Any, batch: List[Any]) -> List[Any]:
+        threads.add(("build", threading.get_ident()))
+        return original(model, batch)
+
+    monkeypatch.setattr(asyncload, "_load_batch", spy)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = _collect(source(), batch_size=5, executor=executor)
+
+    assert len(result) == len(RECORDS)
+    assert ("source", loop_thread) in threads
+    assert ("build", loop_thread) not in threads
+
+
+def test_load_async_process_pool() -> None:
+    """Pass/fail"""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = _collect(_pages(RECORDS), batch_size=10, executor=executor)
+
+    assert result == AsyncModel.load_many(RECORDS)
@@ -0,0 +1,180 @@
+"""
+Tests for ./softboiled/codegen.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import List
+from typing import Tuple
+
+from softboiled import codegen
+from softboiled import lazy
+from softboiled.softboiled import FieldPlan
+
+
+class Inner:
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+
+def _builder(value: Any) -> Any:
+    if isinstance(value, list):
+        return [Inner(**val) for val in value]
+    return Inner(**value)
+
+
+FIELDS = (
+    FieldPlan(name="plain", default=None, optional=False, nested=None),
+    FieldPlan(name="with_default", default=42, optional=False, nested=None),
+    FieldPlan(name="factory", default=None, optional=False, nested=None, factory=list),
+    FieldPlan(name="maybe", default=None, optional=True, nested=None),
+    FieldPlan(
+        name="inner", default=None, optional=True, nested=Inner, builder=_builder
+    ),
+)
+
+
+def _make(defer: Any = None) -> Tuple[codegen.Cleaner, List[Tuple[Any, str]]]:
+    warnings: List[Tuple[Any, str]] = []
+
+    def warn(cls: Any, name: str) -> None:
+        warnings.append((cls, name))
+
+    return codegen.make_cleaner(Inner, FIELDS, warn, defer), warnings
+
+
+def test_filters_and_fills() -> None:
+    """Unknown keys dropped, missing keys filled, required Nones warned"""
+    cleaner, warnings = _make()
+
+    result = cleaner({"maybe": "yes", "extra": "dropped"})
+
+    assert result == {
+        "plain": None,
+        "with_default": 42,
+        "factory": [],
+        "maybe": "yes",
+        "inner": None,
+    }
+    assert warnings == [(Inner, "plain")]
+
+
+def test_default_factory_called_per_clean() -> None:
+    """Pass/fail"""
+    cleaner, _ = _make()
+
+    assert cleaner({})["factory"] is not cleaner({})["factory"]
+
+
+def test_builds_nested_values_and_lists() -> None:
+    """Pass/fail"""
+    cleaner, _ = _make()
+
+    single = cleaner({"inner": {"a": 1}})["inner"]
+    many = cleaner({"inner": [{"a": 1}, {"a": 2}]})["inner"]
+
+    assert single.kwargs == {"a": 1}
+    assert [inner.kwargs for inner in many] == [{"a": 1}, {"a": 2}]
+
+
+def test_defers_nested_values() -> None:
+    """Pass/fail"""
+    cleaner, _ = _make(lazy.Deferred)
+
+    result = cleaner({"inner": {"a": 1}})["inner"]
+
+    assert isinstance(result, lazy.Deferred)
+    assert result.resolve().kwargs == {"a": 1}
+
+
+def test_does_not_mutate_input() -> None:
+    """Pass/fail"""
+    cleaner, _ = _make()
+    data = {"inner": {"a": 1}, "plain": "here"}
+
+    cleaner(data)
+
+    assert data == {"inner": {"a": 1}, "plain": "here"}
+
+
+def test_overflow_keeps_unknown_keys() -> None:
+    """Pass/fail"""
+    cleaner = codegen.make_cleaner(Inner, FIELDS, lambda *_: None, overflow="maybe")
+    value = {"deep": True}
+
+    result = cleaner({"plain": 1, "extra": value})
+    merged = cleaner({"maybe": {"kept": 1}, "extra": 2})
+
+    assert result["maybe"] == {"extra": value}
+    assert result["maybe"]["extra"] is value
+    assert merged["maybe"] == {"kept": 1, "extra": 2}
+    assert cleaner({"plain": 1})["maybe"] is None
+
+
+def test_overflow_keeps_non_dict_value() -> None:
+    """A non-dict value given for the overflow field is kept under its name"""
+    cleaner = codegen.make_cleaner(Inner, FIELDS, lambda *_: None, overflow="maybe")
+
+    result = cleaner({"maybe": "given", "extra": 2})
+
+    assert result["maybe"] == {"maybe": "given", "extra": 2}
+    assert cleaner({"maybe": "given"})["maybe"] == "given"
+
+
+def test_interns_flagged_fields() -> None:
+    """Pass/fail"""
+    fields = (
+        FieldPlan(name="shared", default=None, optional=True, nested=None, intern=True),
+        FieldPlan(name="unshared", default=None, optional=True, nested=None),
+    )
+    cleaner = codegen.make_cleaner(Inner, fields, lambda *_: None, intern=str.upper)
+
+    result = cleaner({"shared": "a", "unshared": "b"})
+
+    assert result == {"shared": "A", "unshared": "b"}
+    assert cleaner({})["shared"] is None
+
+
+def test_reads_aliases_in_order() -> None:
+    """The field name is read first, then each alias in declared order"""
+    fields = (
+        FieldPlan(
+            name="plain",
+            default="none",
+            optional=True,
+            nested=None,
+            aliases=("first", "second"),
+        ),
+        FieldPlan(
+            name="inner",
+            default=None,
+            optional=True,
+            nested=Inner,
+            aliases=("innerAlias",),
+            builder=_builder,
+        ),
+    )
+    cleaner = codegen.make_cleaner(Inner, fields, lambda *_: None)
+
+    assert cleaner({"second": 2, "first": 1})["plain"] == 1
+    assert cleaner({"second": 2, "plain": 0})["plain"] == 0
+    assert cleaner({"second": 2})["plain"] == 2
+    assert cleaner({})["plain"] == "none"
+    assert cleaner({"innerAlias": {"a": 1}})["inner"].kwargs == {"a": 1}
+
+
+def test_converts_then_interns() -> None:
+    """Pass/fail"""
+    fields = (
+        FieldPlan(
+            name="number",
+            default=None,
+            optional=True,
+            nested=None,
+            intern=True,
+            converter=str.strip,
+        ),
+    )
+    cleaner = codegen.make_cleaner(Inner, fields, lambda *_: None, intern=str.upper)
+
+    assert cleaner({"number": " one "}) == {"number": "ONE"}
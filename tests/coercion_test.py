@@ -0,0 +1,85 @@
+"""
+Tests for ./softboiled/coercion.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import datetime
+import enum
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Union
+
+import pytest
+from softboiled import coercion
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    ("hint", "value", "expected"),
+    [
+        (int, "42", 42),
+        (int, 42.0, 42),
+        (int, 42.5, 42.5),
+        (int, "forty two", "forty two"),
+        (int, None, None),
+        (float, "1.5", 1.5),
+        (float, 2, 2.0),
+        (float, "wide", "wide"),
+        (bool, "True", True),
+        (bool, " no ", False),
+        (bool, 1, True),
+        (bool, 0, False),
+        (bool, "maybe", "maybe"),
+        (bool, 2, 2),
+        (
+            datetime.datetime,
+            "2022-04-01T12:30:00Z",
+            datetime.datetime(2022, 4, 1, 12, 30, tzinfo=UTC),
+        ),
+        (
+            datetime.datetime,
+            "2022-04-01T12:30:00",
+            datetime.datetime(2022, 4, 1, 12, 30),
+        ),
+        (datetime.datetime, "yesterday", "yesterday"),
+        (datetime.date, "2022-04-01", datetime.date(2022, 4, 1)),
+        (datetime.date, "April", "April"),
+        (Color, "red", Color.RED),
+        (Color, Color.BLUE, Color.BLUE),
+        (Color, "green", "green"),
+        (Optional[int], "7", 7),
+        (Union[None, bool], "yes", True),
+    ],
+)
+def test_converters(hint: Any, value: Any, expected: Any) -> None:
+    """Pass/fail"""
+    converter = coercion.make_converter(hint)
+
+    assert converter is not None
+    result = converter(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize("hint", [str, Any, List[int], Union[int, str], "int"])
+def test_no_converter(hint: Any) -> None:
+    """Pass/fail"""
+    assert coercion.make_converter(hint) is None
+
+
+def test_given_function_skips_none() -> None:
+    """Pass/fail"""
+    converter = coercion.make_converter(str, str.upper)
+
+    assert converter is not None
+    assert converter("loud") == "LOUD"
+    assert converter(None) is None
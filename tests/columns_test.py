@@ -0,0 +1,90 @@
+"""
+Tests for ./softboiled/columns.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+from typing import List
+
+import pytest
+from softboiled import SoftBoiled
+from softboiled.columns import Columns
+
+
+@dataclasses.dataclass
+class Row:
+    id: int
+    name: str
+
+
+COLUMNS = Columns(Row, {"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+
+def test_column_access() -> None:
+    """Pass/fail"""
+    assert COLUMNS.column("id") == [1, 2, 3]
+    assert COLUMNS.row(1) == {"id": 2, "name": "b"}
+    assert len(COLUMNS) == 3
+
+
+def test_rows_materialize() -> None:
+    """Pass/fail"""
+    assert COLUMNS[0] == Row(1, "a")
+    assert COLUMNS[-1] == Row(3, "c")
+    assert COLUMNS[1:] == [Row(2, "b"), Row(3, "c")]
+    assert list(COLUMNS) == [Row(1, "a"), Row(2, "b"), Row(3, "c")]
+
+
+def test_index_out_of_range() -> None:
+    """Pass/fail"""
+    with pytest.raises(IndexError):
+        COLUMNS[3]
+
+
+def test_uneven_columns() -> None:
+    """Pass/fail"""
+    with pytest.raises(ValueError):
+        Columns(Row, {"id": [1], "name": []})
+
+
+def test_from_rows() -> None:
+    """Pass/fail"""
+    rows = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    result = Columns.from_rows(Row, ["id", "name"], rows)
+
+    assert result.columns == {"id": [1, 2], "name": ["a", "b"]}
+
+
+def test_empty() -> None:
+    """Pass/fail"""
+    result = Columns.from_rows(Row, ["id", "name"], [])
+
+    assert len(result) == 0
+    assert list(result) == []
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Inner:
+    x: int
+
+
+@SoftBoiled.options(lazy=True)
+@dataclasses.dataclass
+class LazyRow:
+    id: int
+    inner: Inner
+    items: List[Inner]
+
+
+def test_lazy_values_resolved() -> None:
+    """Columns of a lazy class never hand out unbuilt nested values"""
+    records = [{"id": 1, "inner": {"x": 1}, "items": [{"x": 2}]}] * 2
+
+    result = LazyRow.load_columns(records)
+
+    assert result.column("inner") == [Inner(x=1), Inner(x=1)]
+    assert result.row(1) == {"id": 1, "inner": Inner(x=1), "items": [Inner(x=2)]}
+    assert result.column("items") == [[Inner(x=2)], [Inner(x=2)]]
+    assert result[0] == LazyRow(id=1, inner=Inner(x=1), items=[Inner(x=2)])
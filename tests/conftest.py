@@ -0,0 +1,57 @@
+"""
+Shared fixtures for ./tests
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import Generator
+
+import pytest
+from softboiled import SoftBoiled
+
+
+@pytest.fixture(params=[False, True], ids=["generic", "codegen"])
+def cleaning_mode(request: Any) -> Generator[bool, None, None]:
+    """Run a test under both the generic and the generated cleaning modes"""
+    original = SoftBoiled.codegen
+    SoftBoiled.codegen = request.param
+    SoftBoiled.plans.clear()
+
+    yield request.param
+
+    SoftBoiled.codegen = original
+    SoftBoiled.plans.clear()
+
+
+@pytest.fixture
+def warning_policy() -> Generator[None, None, None]:
+    """Restore the warning policy and clear key counts after a test"""
+    SoftBoiled.keycounts.reset()
+
+    yield None
+
+    SoftBoiled.setwarnings("instance", 60.0)
+    SoftBoiled.keycounts.reset()
+
+
+@pytest.fixture
+def instrument() -> Generator[None, None, None]:
+    """Turn on drift instrumentation for a test"""
+    SoftBoiled.instrument = True
+    SoftBoiled.drift.reset()
+
+    yield None
+
+    SoftBoiled.instrument = False
+    SoftBoiled.drift.reset()
+
+
+@pytest.fixture
+def validations() -> Generator[None, None, None]:
+    """Clear validation counts and the mismatch callback after a test"""
+    SoftBoiled.validations.reset()
+
+    yield None
+
+    SoftBoiled.onmismatch = None
+    SoftBoiled.validations.reset()
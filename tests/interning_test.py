@@ -0,0 +1,56 @@
+"""
+Tests for ./softboiled/interning.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+
+import pytest
+from softboiled.interning import InternTable
+
+
+def _copy(value: str) -> str:
+    """Returns an equal string that is a different object"""
+    return "".join(list(value))
+
+
+def test_equal_strings_shared() -> None:
+    """Pass/fail"""
+    table = InternTable()
+    first = table.intern(_copy("manager"))
+
+    result = table.intern(_copy("manager"))
+
+    assert result is first
+    assert "manager" in table
+    assert len(table) == 1
+
+
+@pytest.mark.parametrize("value", [None, 1, 1.5, True, b"bytes", ["list"]])
+def test_other_types_unchanged(value: Any) -> None:
+    """Pass/fail"""
+    table = InternTable()
+
+    assert table.intern(value) is value
+    assert len(table) == 0
+
+
+def test_bounded() -> None:
+    """Held values are still shared once full, new values are not held"""
+    table = InternTable(maxsize=1)
+    held = table.intern(_copy("held"))
+
+    assert table.intern(_copy("held")) is held
+    assert table.intern("new") == "new"
+    assert "new" not in table
+    assert len(table) == 1
+
+
+def test_clear() -> None:
+    """Pass/fail"""
+    table = InternTable()
+    table.intern("value")
+
+    table.clear()
+
+    assert len(table) == 0
@@ -0,0 +1,144 @@
+"""
+Tests for ./softboiled/jsonstream.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import io
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+
+import pytest
+from softboiled import jsonstream
+
+RECORDS: List[Dict[str, Any]] = [
+    {"id": 1, "name": "One", "nested": {"list": [1, 2, {"deep": "]},"}]}},
+    {"id": 2, "name": 'Two "quoted" ünïcode', "number": 12345.678e3},
+    {"id": 3, "name": None, "flag": True},
+]
+
+DOCUMENT: Dict[str, Any] = {
+    "more": True,
+    "skipped": {"users": [{"id": "not me"}]},
+    "users": RECORDS,
+    "limit": 25,
+}
+
+
+def test_iter_jsonlines() -> None:
+    """Pass/fail"""
+    lines = "\n".join(json.dumps(record) for record in RECORDS) + "\n\n"
+
+    result = list(jsonstream.iter_jsonlines(io.StringIO(lines)))
+
+    assert result == RECORDS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, jsonstream.CHUNK_SIZE])
+def test_iter_array_text(chunk_size: int) -> None:
+    """Records are found under the key regardless of chunk boundaries"""
+    fileobj = io.StringIO(json.dumps(DOCUMENT, indent=2))
+
+    result = list(jsonstream.iter_array(fileobj, "users", chunk_size))
+
+    assert result == RECORDS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, jsonstream.CHUNK_SIZE])
+def test_iter_array_bytes(chunk_size: int) -> None:
+    """Multi-byte characters split across chunks decode correctly"""
+    fileobj = io.BytesIO(json.dumps(DOCUMENT, ensure_ascii=False).encode())
+
+    result = list(jsonstream.iter_array(fileobj, "users", chunk_size))
+
+    assert result == RECORDS
+
+
+def test_iter_array_numbers_split_across_chunks() -> None:
+    """A number touching the end of the buffer is not cut short"""
+    fileobj = io.StringIO('{"values": [12345, 67890]}')
+
+    result = list(jsonstream.iter_array(fileobj, "values", 3))
+
+    assert result == [12345, 67890]
+
+
+def test_iter_array_empty() -> None:
+    """Pass/fail"""
+    fileobj = io.StringIO('{"users": [ ]}')
+
+    assert list(jsonstream.iter_array(fileobj, "users")) == []
+
+
+def test_iter_array_missing_key() -> None:
+    """Pass/fail"""
+    fileobj = io.StringIO('{"teams": []}')
+
+    with pytest.raises(ValueError):
+        list(jsonstream.iter_array(fileobj, "users"))
+
+
+def test_iter_array_not_an_array() -> None:
+    """Pass/fail"""
+    fileobj = io.StringIO('{"users": {"id": 1}}')
+
+    with pytest.raises(ValueError):
+        list(jsonstream.iter_array(fileobj, "users"))
+
+
+TRICKY: List[Any] = [
+    'quote " and backslash \\ and \\" both',
+    "brackets ]}[{ and commas , in a string",
+    {"esc\\aped": ["é☃", "tab\tnew\nline", ""]},
+    -1.5e-3,
+    [True, False, None, [], {}],
+]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_iter_array_escapes_split_across_chunks(chunk_size: int) -> None:
+    """Escapes and structural characters in strings at every chunk boundary"""
+    document = json.dumps({"skip": TRICKY, "values": TRICKY})
+
+    result = list(jsonstream.iter_array(io.StringIO(document), "values", chunk_size))
+
+    assert result == TRICKY
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, jsonstream.CHUNK_SIZE])
+def test_iter_array_skipped_values_not_decoded(chunk_size: int) -> None:
+    """Values of other keys are only scanned, so invalid values are skipped"""
+    fileobj = io.StringIO('{"skipped": [tru, {"a": 01}, "]"], "users": [1, 2]}')
+
+    result = list(jsonstream.iter_array(fileobj, "users", chunk_size))
+
+    assert result == [1, 2]
+
+
+def test_skip_holds_one_chunk() -> None:
+    """A skipped value is not held in the buffer while it is scanned"""
+    document = json.dumps([{"id": idx, "tags": ["x"] * 10} for idx in range(1_000)])
+    reader = jsonstream._Reader(io.StringIO(document + " 42"), 64)
+
+    reader.skip()
+
+    assert len(reader.buffer) <= 64
+    assert reader.decode() == 42
+
+
+@pytest.mark.parametrize("text", ["12345", "true", "null", '"text"', "[1, [2]]"])
+def test_decode_value_at_end_of_file(text: str) -> None:
+    """Pass/fail"""
+    reader = jsonstream._Reader(io.StringIO(text), 2)
+
+    assert reader.decode() == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ['"open', "[1, 2", '{"a": "\\'])
+def test_truncated_value(text: str) -> None:
+    """Pass/fail"""
+    reader = jsonstream._Reader(io.StringIO(text), 2)
+
+    with pytest.raises(ValueError):
+        reader.skip()
@@ -0,0 +1,84 @@
+"""
+Tests for ./softboiled/keycounter.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+from softboiled.keycounter import DriftCounter
+from softboiled.keycounter import KeyCounter
+from softboiled.keycounter import ValidationCounter
+
+
+class Model:
+    ...
+
+
+def test_counts_and_snapshot() -> None:
+    """Pass/fail"""
+    counter = KeyCounter()
+
+    assert counter.count_missing(Model, "one") == 1
+    assert counter.count_missing(Model, "one") == 2
+    counter.count_extra(Model, ["two", "three"])
+
+    assert counter.snapshot() == {
+        "missing": {"keycounter_test:Model": {"one": 2}},
+        "extra": {"keycounter_test:Model": {"two": 1, "three": 1}},
+    }
+
+
+def test_summary_since_previous() -> None:
+    """Pass/fail"""
+    counter = KeyCounter()
+    counter.count_missing(Model, "one")
+
+    assert counter.summary() == "missing keycounter_test:Model.one=1"
+    assert counter.summary() == ""
+
+    counter.count_extra(Model, ["two"])
+
+    assert counter.summary() == "extra keycounter_test:Model.two=1"
+
+
+def test_reset() -> None:
+    """Pass/fail"""
+    counter = KeyCounter()
+    counter.count_missing(Model, "one")
+    counter.count_extra(Model, ["two"])
+
+    counter.reset()
+
+    assert counter.snapshot() == {"missing": {}, "extra": {}}
+    assert counter.summary() == ""
+
+
+def test_drift_counter() -> None:
+    """Pass/fail"""
+    counter = DriftCounter()
+
+    counter.record(Model, extra=2, missing=1, nested=0)
+    counter.record(Model, extra=0, missing=3, nested=4)
+
+    assert counter.snapshot() == {
+        "keycounter_test:Model": {"instances": 2, "extra": 2, "missing": 4, "nested": 4}
+    }
+
+    counter.reset()
+
+    assert counter.snapshot() == {}
+
+
+def test_validation_counter() -> None:
+    """Pass/fail"""
+    counter = ValidationCounter()
+
+    counter.record(Model, [])
+    counter.record(Model, ["one", "two"])
+    counter.record(Model, iter(["one"]))
+
+    assert counter.snapshot() == {
+        "keycounter_test:Model": {"checked": 3, "mismatched": {"one": 2, "two": 1}}
+    }
+
+    counter.reset()
+
+    assert counter.snapshot() == {}
@@ -0,0 +1,56 @@
+"""
+Tests for ./softboiled/lazy.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+from typing import Any
+from typing import List
+
+import pytest
+from softboiled import lazy
+
+
+@dataclasses.dataclass
+class Holder:
+    data01: Any = "default"
+
+
+lazy.install(Holder, ["data01"])
+
+
+def test_deferred_resolve() -> None:
+    """Pass/fail"""
+    deferred = lazy.Deferred(len, [1, 2, 3])
+
+    assert deferred.resolve() == 3
+
+
+def test_lazy_field_resolves_once() -> None:
+    """Pass/fail"""
+    calls: List[Any] = []
+
+    def builder(value: Any) -> Any:
+        calls.append(value)
+        return value
+
+    holder = Holder(lazy.Deferred(builder, "raw"))
+
+    assert holder.data01 == "raw"
+    assert holder.data01 == "raw"
+    assert calls == ["raw"]
+
+
+def test_lazy_field_class_default() -> None:
+    """Pass/fail"""
+    assert Holder.data01 == "default"
+    assert Holder().data01 == "default"
+
+
+def test_lazy_field_unset() -> None:
+    """Pass/fail"""
+    holder = Holder()
+    del holder.__dict__["data01"]
+
+    with pytest.raises(AttributeError):
+        holder.data01
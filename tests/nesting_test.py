@@ -0,0 +1,110 @@
+"""
+Tests for ./softboiled/nesting.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+import pytest
+from softboiled import nesting
+
+
+class Model:
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Model) and other.kwargs == self.kwargs
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.kwargs.items()))
+
+
+def _asmodel(hint: Any) -> Optional[Type[Any]]:
+    return Model if hint is Model else None
+
+
+def _build(cls: Type[Any], data: Dict[str, Any]) -> Any:
+    return cls(**data)
+
+
+def _builder(hint: Any) -> Any:
+    return nesting.make_builder(hint, _asmodel, _build)
+
+
+@pytest.mark.parametrize(
+    "hint",
+    [int, str, List[int], Dict[str, str], Tuple[int, ...], Optional[str], Any],
+)
+def test_no_builder_without_models(hint: Any) -> None:
+    """Pass/fail"""
+    assert _builder(hint) is None
+
+
+@pytest.mark.parametrize(
+    ("hint", "value", "expected"),
+    [
+        (Model, {"a": 1}, Model(a=1)),
+        (Model, [{"a": 1}], [Model(a=1)]),
+        (Model, None, None),
+        (Optional[Model], None, None),
+        (Union[None, Model], {"a": 1}, Model(a=1)),
+        (List[Model], [{"a": 1}, {"a": 2}], [Model(a=1), Model(a=2)]),
+        (Optional[List[Model]], None, None),
+        (Sequence[Model], ({"a": 1},), [Model(a=1)]),
+        (Set[Model], [{"a": 1}, {"a": 1}], {Model(a=1)}),
+        (Tuple[Model, ...], [{"a": 1}], (Model(a=1),)),
+        (Tuple[int, Model], [1, {"a": 1}], (1, Model(a=1))),
+        (Dict[str, Model], {"x": {"a": 1}}, {"x": Model(a=1)}),
+        (Mapping[str, List[Model]], {"x": [{"a": 1}]}, {"x": [Model(a=1)]}),
+    ],
+)
+def test_builders(hint: Any, value: Any, expected: Any) -> None:
+    """Pass/fail"""
+    assert _builder(hint)(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("hint", "value"),
+    [
+        (List[Model], {"a": 1}),
+        (List[Model], "ab"),
+        (List[Model], 42),
+        (Tuple[Model, ...], "ab"),
+        (Tuple[int, Model], {"a": 1}),
+        (Tuple[int, Model], 42),
+        (Dict[str, Model], [{"a": 1}]),
+        (Dict[str, Model], "ab"),
+        (Dict[str, Model], 42),
+    ],
+)
+def test_mismatched_containers_pass_through(hint: Any, value: Any) -> None:
+    """Pass/fail"""
+    assert _builder(hint)(value) is value
+
+
+@pytest.mark.parametrize(
+    ("hint", "value", "expected"),
+    [
+        (Model, {"a": 1}, 1),
+        (Model, [{"a": 1}, {"a": 2}], 2),
+        (Optional[Model], None, 0),
+        (List[Model], [{"a": 1}, None, {"a": 2}], 2),
+        (List[Model], {"a": 1}, 0),
+        (Tuple[int, Model], [1, {"a": 1}], 1),
+        (Dict[str, Model], {"x": {"a": 1}, "y": {"a": 2}}, 2),
+        (Mapping[str, List[Model]], {"x": [{"a": 1}], "y": [{"a": 2}]}, 2),
+    ],
+)
+def test_count_models(hint: Any, value: Any, expected: int) -> None:
+    """Pass/fail"""
+    assert nesting.count_models(_builder(hint), value) == expected
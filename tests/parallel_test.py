@@ -0,0 +1,104 @@
+"""
+Tests for ./softboiled/parallel.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+from softboiled import parallel
+from softboiled import SoftBoiled
+
+RECORDS: List[Dict[str, Any]] = [
+    {"id": idx, "name": f"name {idx}" * (idx % 4), "extra": idx, "inner": {"id": idx}}
+    for idx in range(50)
+]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class ParallelInner:
+    id: int
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class ParallelModel:
+    id: int
+    name: Optional[str]
+    inner: ParallelInner
+
+
+@pytest.fixture
+def jsonl_file(tmp_path: Path) -> str:
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n")
+    return str(path)
+
+
+def test_byte_ranges() -> None:
+    """Pass/fail"""
+    assert parallel.byte_ranges(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert parallel.byte_ranges(0, 4) == []
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 13, 64, 10_000])
+def test_read_range_covers_every_line_once(jsonl_file: str, chunk_bytes: int) -> None:
+    """Lines crossing a range boundary belong to the range they start in"""
+    size = Path(jsonl_file).stat().st_size
+    result: List[Dict[str, Any]] = []
+
+    for start, end in parallel.byte_ranges(size, chunk_bytes):
+        result.extend(parallel.read_range(jsonl_file, start, end))
+
+    assert result == RECORDS
+
+
+def test_load_parallel_ordered() -> None:
+    """Pass/fail"""
+    result = list(ParallelModel.load_parallel(RECORDS, max_workers=2, chunksize=7))
+
+    assert result == ParallelModel.load_many(RECORDS)
+    assert isinstance(result[0].inner, ParallelInner.cls)
+
+
+def test_load_parallel_unordered() -> None:
+    """Pass/fail"""
+    result = ParallelModel.load_parallel(
+        iter(RECORDS), max_workers=2, chunksize=3, ordered=False
+    )
+
+    assert sorted(model.id for model in result) == list(range(50))
+
+
+def test_load_parallel_jsonl(jsonl_file: str) -> None:
+    """Pass/fail"""
+    result = ParallelModel.load_parallel_jsonl(
+        jsonl_file, max_workers=2, chunk_bytes=97
+    )
+
+    assert list(result) == ParallelModel.load_many(RECORDS)
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_load_parallel_invalid_chunk_size(jsonl_file: str, size: int) -> None:
+    """Shard sizes below one raise at the call, not when iterated"""
+    with pytest.raises(ValueError, match="chunksize"):
+        ParallelModel.load_parallel(RECORDS, chunksize=size)
+
+    with pytest.raises(ValueError, match="chunk_bytes"):
+        ParallelModel.load_parallel_jsonl(jsonl_file, chunk_bytes=size)
+
+
+def test_resolve_by_qualified_name() -> None:
+    """Pass/fail"""
+    qualname = SoftBoiled.qualname(ParallelModel.cls)
+
+    assert qualname == "parallel_test:ParallelModel"
+    assert SoftBoiled.resolve(qualname) is ParallelModel
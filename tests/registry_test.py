@@ -0,0 +1,186 @@
+"""
+Tests for ./softboiled/registry.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+import sys
+import threading
+from threading import Thread
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Type
+
+import pytest
+from softboiled import SoftBoiled
+from softboiled.registry import qualname
+from softboiled.registry import Registry
+
+
+class Wrapper:
+    def __init__(self, cls: Type[Any]) -> None:
+        self.cls = cls
+
+
+def _model(name: str, module: str) -> Type[Any]:
+    cls = type(name, (), {})
+    cls.__module__ = module
+    return cls
+
+
+def _registry(*classes: Type[Any]) -> Registry:
+    registry = Registry()
+    for cls in classes:
+        registry.add(cls, Wrapper(cls))
+    return registry
+
+
+USER_A = _model("User", "app.billing.models")
+USER_B = _model("User", "app.support.models")
+TEAM = _model("Team", "app.support.models")
+
+
+def test_same_name_different_modules() -> None:
+    """Pass/fail"""
+    registry = _registry(USER_A, USER_B)
+
+    assert len(registry) == 2
+    assert registry["app.billing.models:User"].cls is USER_A
+    assert registry["app.support.models:User"].cls is USER_B
+    assert registry.forclass(USER_A).cls is USER_A
+    assert registry.forclass(USER_B).cls is USER_B
+
+
+def test_replace_same_qualified_name() -> None:
+    """Redefining a class replaces the old one, it is no longer found"""
+    replacement = _model("User", "app.billing.models")
+    registry = _registry(USER_A, replacement)
+
+    assert len(registry) == 1
+    assert registry.forclass(USER_A) is None
+    assert registry.forclass(replacement).cls is replacement
+
+
+@pytest.mark.parametrize(
+    ("module", "expected"),
+    [
+        ("app.billing.models", USER_A),
+        ("app.billing.views", USER_A),
+        ("app.support", USER_B),
+    ],
+)
+def test_find_prefers_closest_module(module: str, expected: Type[Any]) -> None:
+    """Pass/fail"""
+    registry = _registry(USER_A, USER_B)
+
+    assert registry.find("User", module).cls is expected
+
+
+def test_find_local_by_name() -> None:
+    """Nested and function local classes are found by their bare name"""
+    local = _model("Inner", "app.billing.models")
+    local.__qualname__ = "make.<locals>.Inner"
+    registry = _registry(local)
+
+    assert registry.find("Inner", "app.billing.models").cls is local
+    assert registry.find("make.<locals>.Inner", "app").cls is local
+
+
+def test_find_unknown() -> None:
+    """Pass/fail"""
+    assert _registry(USER_A).find("Team", "app") is None
+
+
+def test_scope() -> None:
+    """Pass/fail"""
+    registry = _registry(USER_A, USER_B, TEAM)
+
+    result: List[str] = sorted(registry.scope("app.support"))
+
+    assert result == ["app.support.models:Team", "app.support.models:User"]
+    assert sorted(registry.scope("app.support.models")) == result
+    assert registry.scope("app.supp") == {}
+
+
+def test_forclass_unhashable() -> None:
+    """Pass/fail"""
+    assert _registry(USER_A).forclass([]) is None
+
+
+def test_qualname() -> None:
+    """Pass/fail"""
+    assert qualname(USER_A) == "app.billing.models:User"
+
+
+def test_snapshot_unchanged_by_later_registration() -> None:
+    """Pass/fail"""
+    registry = _registry(USER_A)
+    before = registry.snapshot
+
+    registry.add(USER_B, Wrapper(USER_B))
+
+    assert list(before.byname) == ["app.billing.models:User"]
+    assert before.byshortname == {"User": ("app.billing.models:User",)}
+    assert len(registry.snapshot.byname) == 2
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class StressInner:
+    id: int
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class StressModel:
+    id: int
+    inner: Optional[StressInner]
+    many: List[StressInner]
+
+
+def test_concurrent_registration_and_construction() -> None:
+    """Registering from many threads never disturbs readers or loses classes"""
+    writers, readers, per_writer = 8, 8, 50
+    barrier = threading.Barrier(writers + readers)
+    errors: List[BaseException] = []
+    record = {"id": 1, "inner": {"id": 2}, "many": [{"id": 3}], "extra": True}
+    expected = StressModel(**record)
+
+    def register(worker: int) -> None:
+        barrier.wait()
+        for idx in range(per_writer):
+            cls = dataclasses.make_dataclass(f"Stress{worker}_{idx}", [("id", int)])
+            cls.__module__ = f"stress.worker{worker}"
+            SoftBoiled(cls)
+
+    def construct() -> None:
+        barrier.wait()
+        for _ in range(per_writer * 4):
+            assert StressModel(**record) == expected
+            assert SoftBoiled.registry.find("StressInner", __name__) is StressInner
+            assert SoftBoiled.registry.forclass(StressModel.cls) is StressModel
+            assert all(key in SoftBoiled.registry for key in SoftBoiled.registry)
+            SoftBoiled.registry.scope("stress")
+
+    def guarded(target: Any, *args: Any) -> None:
+        try:
+            target(*args)
+        except BaseException as err:  # pragma: no cover
+            errors.append(err)
+
+    threads = [Thread(target=guarded, args=(register, idx)) for idx in range(writers)]
+    threads += [Thread(target=guarded, args=(construct,)) for _ in range(readers)]
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    assert len(SoftBoiled.registry.scope("stress")) == writers * per_writer
@@ -0,0 +1,149 @@
+"""
+Tests for ./softboiled/serialize.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import datetime
+import enum
+import json
+from typing import Any
+from typing import Optional
+from typing import Type
+
+import pytest
+from softboiled import serialize
+from softboiled.softboiled import FieldPlan
+
+
+class Point:
+    def __init__(self, x: Any, y: Any) -> None:
+        self.x = x
+        self.y = y
+
+
+class Shape:
+    def __init__(self, name: Any, points: Any) -> None:
+        self.name = name
+        self.points = points
+
+
+POINT_FIELDS = (
+    FieldPlan(name="x", default=None, optional=False, nested=None),
+    FieldPlan(name="y", default=None, optional=True, nested=None),
+)
+SHAPE_FIELDS = (
+    FieldPlan(name="name", default=None, optional=False, nested=None),
+    FieldPlan(name="points", default=None, optional=True, nested=Point, builder=list),
+)
+
+DUMPERS = {
+    Point: serialize.make_dumper(Point, POINT_FIELDS, lambda val, omit: val),
+}
+
+
+def _dumperfor(cls: Type[Any]) -> Optional[serialize.Dumper]:
+    return DUMPERS.get(cls)
+
+
+def _dumpvalue(value: Any, omit_none: bool) -> Any:
+    return serialize.dump_value(value, omit_none, _dumperfor)
+
+
+SHAPE_DUMPER = serialize.make_dumper(Shape, SHAPE_FIELDS, _dumpvalue)
+
+
+def test_plain_values_are_not_copied() -> None:
+    """Pass/fail"""
+    tags = ["a", "b"]
+
+    result = DUMPERS[Point](Point(tags, None), False)
+
+    assert result == {"x": ["a", "b"], "y": None}
+    assert result["x"] is tags
+
+
+def test_nested_values_converted() -> None:
+    """Pass/fail"""
+    shape = Shape("line", [Point(0, 1), Point(2, None)])
+
+    result = SHAPE_DUMPER(shape, False)
+
+    assert result == {"name": "line", "points": [{"x": 0, "y": 1}, {"x": 2, "y": None}]}
+
+
+def test_omit_none_at_every_level() -> None:
+    """Pass/fail"""
+    shape = Shape(None, (Point(2, None),))
+
+    result = SHAPE_DUMPER(shape, True)
+
+    assert result == {"points": ({"x": 2},)}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ({"a": Point(1, 2), "b": None}, {"a": {"x": 1, "y": 2}, "b": None}),
+        (frozenset({Point}), [Point]),
+        ("unchanged", "unchanged"),
+    ],
+)
+def test_dump_value(value: Any, expected: Any) -> None:
+    """Pass/fail"""
+    assert _dumpvalue(value, False) == expected
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request: Any, monkeypatch: Any) -> str:
+    """Run with orjson when installed, and again with the json module"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialize, "orjson", None)
+    return str(request.param)
+
+
+def test_dumps(backend: str) -> None:
+    """Pass/fail"""
+    result = serialize.dumps({"a": 1, "b": {"c"}, "d": None, "e": ("é", 1.5)})
+
+    assert result == '{"a":1,"b":["c"],"d":null,"e":["é",1.5]}'
+
+
+def test_dumps_converted_types(backend: str) -> None:
+    """Enums, datetimes, dates, and times are encoded the same by both"""
+    result = serialize.dumps(
+        {
+            "color": Color.RED,
+            "at": datetime.datetime(2022, 1, 2, 3, 4, 5),
+            "on": datetime.date(2022, 1, 2),
+            "time": datetime.time(3, 4),
+        }
+    )
+
+    assert json.loads(result) == {
+        "color": "red",
+        "at": "2022-01-02T03:04:05",
+        "on": "2022-01-02",
+        "time": "03:04:00",
+    }
+
+
+@pytest.mark.parametrize(
+    ("data", "error"),
+    [
+        ({"a": object()}, TypeError),
+        ({1: "int key"}, TypeError),
+        ({"a": {None: "nested key"}}, TypeError),
+        ({"a": float("nan")}, ValueError),
+        ({"a": [float("inf")]}, ValueError),
+    ],
+)
+def test_dumps_rejected(backend: str, data: Any, error: Type[Exception]) -> None:
+    """Both backends raise the same error for values JSON cannot hold"""
+    with pytest.raises(error):
+        serialize.dumps(data)
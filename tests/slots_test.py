@@ -0,0 +1,33 @@
+"""
+Tests for ./softboiled/slots.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import dataclasses
+
+from softboiled.slots import add_slots
+
+
+@dataclasses.dataclass
+class Plain:
+    data01: str
+    data02: int = 2
+
+
+def test_add_slots() -> None:
+    """Pass/fail"""
+    slotted = add_slots(Plain)
+    result = slotted("one")
+
+    assert slotted is not Plain
+    assert slotted.__qualname__ == Plain.__qualname__
+    assert slotted.__slots__ == ("data01", "data02")
+    assert (result.data01, result.data02) == ("one", 2)
+    assert not hasattr(result, "__dict__")
+
+
+def test_add_slots_already_slotted() -> None:
+    """Pass/fail"""
+    slotted = add_slots(Plain)
+
+    assert add_slots(slotted) is slotted
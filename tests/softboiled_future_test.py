@@ -13,8 +13,11 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
+import pytest
 from softboiled import SoftBoiled
 
+pytestmark = pytest.mark.usefixtures("cleaning_mode")
+
 INNER_NEST: Dict[str, Any] = {
     "data01": "Hi",
     "data02": True,
@@ -84,3 +87,44 @@ def test_just_right_future() -> None:
         NestedLayerF(**INNER_NEST),
         NestedLayerF(**INNER_NEST),
     ]
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class PipeUnion:
+    data01: str | None
+    data02: None | NestedNormF
+    data03: int | str
+
+
+def test_pipe_union_optional(caplog: Any) -> None:
+    """PEP 604 unions with None do not warn, resolved or by name"""
+    result = PipeUnion(data02={"data01": "Norm"})
+
+    assert result.data02 == NestedNormF(data01="Norm")
+    assert [record.args for record in caplog.records] == [("data03",)]
+
+
+def _local_models() -> Any:
+    @SoftBoiled
+    @dataclasses.dataclass
+    class Inner:
+        x: int
+
+    @SoftBoiled
+    @dataclasses.dataclass
+    class Outer:
+        inner: Inner
+        items: List[Inner]
+
+    return Inner, Outer
+
+
+def test_function_local_models() -> None:
+    """Postponed hints name function local classes by their bare name"""
+    inner, outer = _local_models()
+
+    result = outer(inner={"x": 1}, items=[{"x": 2}])
+
+    assert result.inner == inner(x=1)
+    assert result.items == [inner(x=2)]
@@ -4,14 +4,25 @@ Tests for ./softboiled/softboiled.py
 Author: Preocts, discord: Preocts#8196
 """
 import dataclasses
+import datetime
+import enum
+import io
+import json
+import pickle
 from typing import Any
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import pytest
+from softboiled import lazy
 from softboiled import SoftBoiled
 
+pytestmark = pytest.mark.usefixtures("cleaning_mode")
+
 INNER_NEST_SMALL: Dict[str, Any] = {"data01": "Hi"}
 INNER_NEST: Dict[str, Any] = {
     "data01": "Hi",
@@ -167,3 +178,836 @@ def test_set_values_over_default() -> None:
     assert result.data01 == "Hello"
     assert result.data02 is False
     assert result.data03 == 10
+
+
+def test_plan_compiled_once() -> None:
+    """The plan is built on first use and reused after"""
+    _ = TopLayer(**JUST_RIGHT)
+    plan = SoftBoiled.getplan(TopLayer.cls)
+
+    _ = TopLayer(**JUST_RIGHT)
+
+    assert SoftBoiled.getplan(TopLayer.cls) is plan
+    assert plan.expected == {"tdata01", "tdata02", "tdata03", "tdata04"}
+    assert [field.name for field in plan.nested] == ["tdata02", "tdata04"]
+    assert plan.nested[0].nested is NestedLayer.cls
+
+
+def test_plan_recompiled_matches() -> None:
+    """Instances built from a freshly compiled plan match the cached plan"""
+    expected = TopLayer(**JUST_RIGHT)
+    SoftBoiled.plans.pop(TopLayer.cls)
+    SoftBoiled.plans.pop(NestedLayer.cls)
+
+    assert TopLayer(**JUST_RIGHT) == expected
+
+
+def test_nested_ignores_unregistered_dataclass() -> None:
+    """Only SoftBoiled classes are nested, plain dataclasses pass through"""
+
+    @dataclasses.dataclass
+    class Plain:
+        data01: str
+
+    @SoftBoiled
+    @dataclasses.dataclass
+    class HasPlain:
+        data01: Plain
+
+    plain = Plain("Hi")
+    result = HasPlain(data01=plain)
+
+    assert result.data01 is plain
+    assert not SoftBoiled.getplan(HasPlain.cls).nested
+
+
+def test_nested_detection_independent_of_platter() -> None:
+    """Registering many unrelated classes does not change nesting"""
+    for idx in range(100):
+        SoftBoiled(dataclasses.make_dataclass(f"Filler{idx}", [("data01", str)]))
+
+    result = TopLayer(**JUST_RIGHT)
+
+    assert result.tdata02 == NestedLayer(**INNER_NEST)
+    assert SoftBoiled.getplan(TopLayer.cls).nested[0].nested is NestedLayer.cls
+
+
+def test_nested_cleaned_once_per_object(monkeypatch: Any) -> None:
+    """Each object in the nested payload is cleaned exactly one time"""
+    applyplan = SoftBoiled._SoftBoiled__applyplan  # type: ignore
+    passes: Dict[str, int] = {}
+
+    def spy(plan: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+        name = plan.cls.__name__
+        passes[name] = passes.get(name, 0) + 1
+        return applyplan(plan, data)
+
+    monkeypatch.setattr(SoftBoiled, "_SoftBoiled__applyplan", staticmethod(spy))
+
+    _ = TopLayer(**JUST_RIGHT)
+
+    # One top layer, one nested plus two listed, each with one inner norm
+    assert passes == {"TopLayer": 1, "NestedLayer": 3, "NestedNorm": 3}
+
+
+def test_load_many() -> None:
+    """Batch loading matches creating each instance by unpacking"""
+    records = [JUST_RIGHT, TOO_MUCH, JUST_RIGHT]
+
+    result = TopLayer.load_many(iter(records))
+
+    assert result == [TopLayer(**record) for record in records]
+
+
+def test_load_many_empty() -> None:
+    """Pass/fail"""
+    assert NestedNorm.load_many([]) == []
+
+
+def test_iter_load_jsonlines() -> None:
+    """Pass/fail"""
+    lines = io.StringIO("\n".join(json.dumps(rec) for rec in [JUST_RIGHT, TOO_MUCH]))
+
+    result = TopLayer.iter_load(lines)
+
+    assert next(result) == TopLayer(**JUST_RIGHT)
+    assert next(result) == TopLayer(**TOO_MUCH)
+    with pytest.raises(StopIteration):
+        next(result)
+
+
+def test_iter_load_array_under_key() -> None:
+    """Pass/fail"""
+    document = io.BytesIO(json.dumps({"tops": [JUST_RIGHT, TOO_MUCH]}).encode())
+
+    result = list(TopLayer.iter_load(document, key="tops"))
+
+    assert result == [TopLayer(**JUST_RIGHT), TopLayer(**TOO_MUCH)]
+
+
+@pytest.mark.parametrize("encode", [False, True])
+def test_from_json_object(encode: bool) -> None:
+    """Pass/fail"""
+    document = json.dumps(TOO_MUCH)
+
+    result = TopLayer.from_json(document.encode() if encode else document)
+
+    assert result == TopLayer(**TOO_MUCH)
+
+
+def test_from_json_array() -> None:
+    """Pass/fail"""
+    result = TopLayer.from_json(json.dumps([JUST_RIGHT, TOO_MUCH]))
+
+    assert result == [TopLayer(**JUST_RIGHT), TopLayer(**TOO_MUCH)]
+
+
+def test_from_json_not_object() -> None:
+    """Pass/fail"""
+    with pytest.raises(ValueError):
+        TopLayer.from_json("42")
+
+
+def test_cleaner_follows_mode(cleaning_mode: bool, caplog: Any) -> None:
+    """Generated cleaners are only compiled in codegen mode"""
+    result = TopLayer(**TOO_SMALL)
+    warned = [record.args for record in caplog.records]
+
+    assert (SoftBoiled.getplan(TopLayer.cls).cleaner is not None) is cleaning_mode
+    assert result.tdata04 == [
+        NestedLayer(**INNER_NEST_SMALL),
+        NestedLayer(**INNER_NEST_SMALL),
+    ]
+    # Nested warnings come first, then the top layer in field order
+    assert warned == [
+        ("data02",),
+        ("data03",),
+        ("data02",),
+        ("data03",),
+        ("tdata01",),
+        ("tdata02",),
+    ]
+
+
+def test_pickle_round_trip() -> None:
+    """Instances and wrappers pickle through the registry"""
+    result = TopLayer(**JUST_RIGHT)
+
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert pickle.loads(pickle.dumps(TopLayer)) is TopLayer
+
+
+def test_resolve_unknown() -> None:
+    """Pass/fail"""
+    with pytest.raises(KeyError):
+        SoftBoiled.resolve("softboiled_test:NotHere")
+
+
+@pytest.mark.usefixtures("warning_policy")
+def test_warnings_per_instance(caplog: Any) -> None:
+    """Pass/fail"""
+    _ = NestedLayer(data01="Hi", data04="extra")
+    _ = NestedLayer(data01="Hi", data04="extra", data05="extra")
+
+    assert len(caplog.records) == 4
+    assert SoftBoiled.keycounts.snapshot() == {
+        "missing": {"softboiled_test:NestedLayer": {"data02": 2, "data03": 2}},
+        "extra": {"softboiled_test:NestedLayer": {"data04": 2, "data05": 1}},
+    }
+
+
+@pytest.mark.usefixtures("warning_policy")
+def test_warnings_once(caplog: Any) -> None:
+    """Pass/fail"""
+    SoftBoiled.setwarnings("once")
+
+    _ = NestedLayer(data01="Hi")
+    _ = NestedLayer(data01="Hi")
+
+    assert [record.args for record in caplog.records] == [("data02",), ("data03",)]
+    assert SoftBoiled.keycounts.missing[(NestedLayer.cls, "data02")] == 2
+
+
+@pytest.mark.usefixtures("warning_policy")
+def test_warnings_summary(caplog: Any) -> None:
+    """Summaries are logged once the interval passes, with counts since last"""
+    SoftBoiled.setwarnings("summary", summaryinterval=3600)
+    SoftBoiled.logsummary()
+
+    _ = NestedLayer(data01="Hi", data04="extra")
+    assert not caplog.records
+
+    SoftBoiled.setwarnings("summary", summaryinterval=0)
+    _ = NestedLayer(data01="Hi", data02=True, data03={}, data04="extra")
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "missing softboiled_test:NestedLayer.data02=1" in message
+    assert "extra softboiled_test:NestedLayer.data04=2" in message
+
+
+@pytest.mark.usefixtures("warning_policy")
+def test_warnings_off(caplog: Any) -> None:
+    """Pass/fail"""
+    SoftBoiled.setwarnings("off")
+
+    _ = NestedLayer(data04="extra")
+
+    assert not caplog.records
+    assert SoftBoiled.keycounts.snapshot() == {"missing": {}, "extra": {}}
+
+
+def test_warnings_unknown_policy() -> None:
+    """Pass/fail"""
+    with pytest.raises(ValueError):
+        SoftBoiled.setwarnings("sometimes")
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Nullables:
+    data01: Union[str, None]
+    data02: Union[None, int, str]
+    data03: Any
+    data04: Optional["NestedNorm"]
+    data05: List[Optional[str]]
+
+
+def test_optional_from_type_hints(caplog: Any) -> None:
+    """Every form of optional hint is recognized, only data05 warns"""
+    _ = Nullables()
+
+    assert [record.args for record in caplog.records] == [("data05",)]
+    assert [field.optional for field in SoftBoiled.getplan(Nullables.cls).fields] == [
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_pipe_operator_on_decorated_class() -> None:
+    """Pass/fail"""
+    assert (NestedNorm | None) == Optional[NestedNorm.cls]
+    assert (None | NestedNorm) == Union[None, NestedNorm.cls]
+
+
+@pytest.mark.usefixtures("instrument")
+def test_drift_instrumentation() -> None:
+    """Pass/fail"""
+    _ = TopLayer(**TOO_MUCH)
+
+    assert SoftBoiled.drift.snapshot() == {
+        "softboiled_test:TopLayer": {
+            "instances": 1,
+            "extra": 1,
+            "missing": 0,
+            "nested": 3,
+        },
+        "softboiled_test:NestedLayer": {
+            "instances": 3,
+            "extra": 2,
+            "missing": 0,
+            "nested": 3,
+        },
+        "softboiled_test:NestedNorm": {
+            "instances": 3,
+            "extra": 0,
+            "missing": 0,
+            "nested": 0,
+        },
+    }
+
+    SoftBoiled.drift.reset()
+
+    assert SoftBoiled.drift.snapshot() == {}
+
+
+def test_drift_instrumentation_off_by_default() -> None:
+    """Pass/fail"""
+    _ = TopLayer(**TOO_SMALL)
+
+    assert SoftBoiled.drift.snapshot() == {}
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class DriftShapes:
+    many: Optional[Dict[str, NestedNorm]] = None
+    one: Optional[NestedNorm] = None
+
+
+@pytest.mark.usefixtures("instrument")
+def test_drift_nested_counts_models() -> None:
+    """None is not counted, containers and aliased values count each model"""
+    DriftShapes(many={"x": {"data01": "x"}, "y": {"data01": "y"}}, one=None)
+    Aliased(innerNorm={"data01": "x"})
+
+    result = SoftBoiled.drift.snapshot()
+
+    assert result["softboiled_test:DriftShapes"]["nested"] == 2
+    assert result["softboiled_test:Aliased"]["nested"] == 1
+
+
+@SoftBoiled.options(slots=True)
+@dataclasses.dataclass
+class SlottedLayer:
+    data01: Optional[str]
+    data02: bool = False
+    data03: Optional[NestedNorm] = None
+
+
+@SoftBoiled.options(slots=True)
+@dataclasses.dataclass(frozen=True)
+class FrozenSlotted:
+    data01: str = "frozen"
+
+
+def test_slots_option() -> None:
+    """Slotted instances clean and nest as usual without a __dict__"""
+    result = SlottedLayer(**INNER_NEST_LARGE)
+
+    assert result.data01 == "Hi"
+    assert result.data02 is True
+    assert result.data03 == NestedNorm(data01="Norm")
+    assert SlottedLayer.cls.__slots__ == ("data01", "data02", "data03")
+    assert not hasattr(result, "__dict__")
+    assert SlottedLayer().data02 is False
+
+
+def test_slots_pickle() -> None:
+    """Pass/fail"""
+    slotted = SlottedLayer(**INNER_NEST)
+    frozen = FrozenSlotted(data01="cold")
+
+    assert pickle.loads(pickle.dumps(slotted)) == slotted
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.data01 = "thawed"  # type: ignore
+
+
+def test_load_columns() -> None:
+    """Columns clean like the constructor and build the same instances"""
+    records = [JUST_RIGHT, TOO_MUCH, TOO_SMALL]
+
+    result = TopLayer.load_columns(records)
+
+    assert list(result.columns) == ["tdata01", "tdata02", "tdata03", "tdata04"]
+    assert result.column("tdata03") == [
+        JUST_RIGHT["tdata03"],
+        TOO_MUCH["tdata03"],
+        None,
+    ]
+    assert list(result) == [TopLayer(**record) for record in records]
+
+
+@SoftBoiled.options(lazy=True)
+@dataclasses.dataclass
+class LazyLayer:
+    tdata01: str
+    tdata02: NestedLayer
+    tdata04: Optional[List[NestedLayer]] = None
+
+
+def test_lazy_nested_built_on_access() -> None:
+    """Nested data is held raw until read, then built once and cached"""
+    result = LazyLayer(**JUST_RIGHT)
+
+    assert isinstance(result.__dict__["tdata02"], lazy.Deferred)
+    assert isinstance(result.__dict__["tdata04"], lazy.Deferred)
+
+    first = result.tdata02
+
+    assert first == NestedLayer(**INNER_NEST)
+    assert result.tdata02 is first
+    assert result.__dict__["tdata02"] is first
+    assert result.tdata04 == [NestedLayer(**INNER_NEST), NestedLayer(**INNER_NEST)]
+
+
+def test_lazy_matches_eager() -> None:
+    """Equality, repr, and pickling see the built values"""
+    result = LazyLayer(**TOO_MUCH)
+    eager = TopLayer(**TOO_MUCH)
+
+    assert result.tdata02 == eager.tdata02
+    assert result == LazyLayer(**TOO_MUCH)
+    assert pickle.loads(pickle.dumps(LazyLayer(**TOO_MUCH))) == result
+    assert "Deferred" not in repr(LazyLayer(**TOO_MUCH))
+
+
+def test_lazy_defaults_and_assignment() -> None:
+    """Pass/fail"""
+    result = LazyLayer(tdata01="Hi", tdata02=INNER_NEST)
+
+    assert result.tdata04 is None
+    assert LazyLayer.cls.tdata04 is None
+
+    result.tdata04 = []
+
+    assert result.tdata04 == []
+
+
+def test_lazy_with_slots_not_supported() -> None:
+    """Pass/fail"""
+    with pytest.raises(ValueError):
+
+        @SoftBoiled.options(slots=True, lazy=True)
+        @dataclasses.dataclass
+        class LazySlots:
+            data01: NestedNorm
+
+
+@SoftBoiled.options(overflow="extra")
+@dataclasses.dataclass
+class Overflowing:
+    data01: Optional[str] = None
+    extra: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+def test_overflow_keeps_unknown_keys() -> None:
+    """Pass/fail"""
+    value = {"deep": ["list"]}
+
+    result = Overflowing(data01="Hi", data02=value, data03=3)
+
+    assert result.data01 == "Hi"
+    assert result.extra == {"data02": value, "data03": 3}
+    assert result.extra["data02"] is value
+
+
+def test_overflow_empty_and_round_trip() -> None:
+    """Pass/fail"""
+    result = Overflowing(data01="Hi", data02=2)
+
+    assert Overflowing(data01="Hi").extra == {}
+    assert Overflowing(**Overflowing.to_dict(result)) == result
+
+
+@pytest.mark.parametrize("given", ["text", 42, ["list"]])
+def test_overflow_keeps_non_dict_value(given: Any) -> None:
+    """A non-dict value given for the overflow field is kept under its name"""
+    result = Overflowing(data01="Hi", extra=given, data02=2)
+
+    assert result.extra == {"extra": given, "data02": 2}
+    assert Overflowing(data01="Hi", extra=given).extra is given
+
+
+def test_overflow_merges_given_dict() -> None:
+    """Pass/fail"""
+    result = Overflowing(extra={"data02": 1, "kept": True}, data02=2)
+
+    assert result.extra == {"data02": 2, "kept": True}
+
+
+def test_overflow_must_be_a_field() -> None:
+    """Pass/fail"""
+    with pytest.raises(ValueError):
+
+        @SoftBoiled.options(overflow="missing")
+        @dataclasses.dataclass
+        class NoOverflow:
+            data01: str
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Interned:
+    data01: Optional[str] = dataclasses.field(default=None, metadata={"intern": True})
+    data02: Optional[str] = None
+
+
+def test_intern_shares_field_values() -> None:
+    """Only fields flagged for interning share equal values"""
+    first = json.loads('{"data01": "role", "data02": "name"}')
+    second = json.loads('{"data01": "role", "data02": "name"}')
+
+    one = Interned(**first)
+    two = Interned(**second)
+
+    assert one == two
+    assert one.data01 is two.data01
+    assert one.data02 is not two.data02
+    assert "role" in SoftBoiled.interned
+    assert Interned(data01=1).data01 == 1
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class InternedConverted:
+    data01: Optional[str] = dataclasses.field(
+        default=None, metadata={"intern": True, "coerce": str.lower}
+    )
+
+
+def test_intern_converted_values(cleaning_mode: bool) -> None:
+    """Values are interned after conversion, in both cleaning modes"""
+    one = InternedConverted(data01="SHARED Role")
+    two = InternedConverted(data01="Shared ROLE")
+
+    assert one.data01 == "shared role"
+    assert one.data01 is two.data01
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Aliased:
+    default_role: Optional[str] = dataclasses.field(
+        default=None, metadata={"alias": "defaultRole"}
+    )
+    kind: Optional[str] = dataclasses.field(
+        default=None, metadata={"alias": ("type", "kindOf")}
+    )
+    inner: Optional[NestedNorm] = dataclasses.field(
+        default=None, metadata={"alias": "innerNorm"}
+    )
+
+
+def test_alias_keys_remapped(caplog: Any) -> None:
+    """Pass/fail"""
+    result = Aliased(defaultRole="observer", type="team", innerNorm={"data01": "x"})
+
+    assert result == Aliased(
+        default_role="observer", kind="team", inner=NestedNorm(data01="x")
+    )
+    assert not caplog.records
+
+
+def test_alias_precedence() -> None:
+    """The field name wins over aliases, earlier aliases over later ones"""
+    result = Aliased(defaultRole="alias", default_role="name", kindOf="b", type="a")
+
+    assert result.default_role == "name"
+    assert result.kind == "a"
+
+
+@pytest.mark.usefixtures("warning_policy")
+def test_alias_keys_not_extra() -> None:
+    """Pass/fail"""
+    Aliased(defaultRole="observer", unknown=True)
+
+    assert SoftBoiled.keycounts.snapshot()["extra"] == {
+        "softboiled_test:Aliased": {"unknown": 1}
+    }
+
+
+class Level(enum.Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+@SoftBoiled.options(coerce=True)
+@dataclasses.dataclass
+class Coerced:
+    data01: Optional[int] = None
+    data02: Optional[bool] = None
+    data03: Optional[datetime.datetime] = None
+    data04: Optional[Level] = None
+    data05: Optional[str] = dataclasses.field(
+        default=None, metadata={"coerce": str.lower, "alias": "data05Alias"}
+    )
+    data06: Optional[NestedNorm] = None
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class NotCoerced:
+    data01: Optional[int] = None
+    data02: Optional[str] = dataclasses.field(
+        default=None, metadata={"coerce": str.lower}
+    )
+
+
+def test_coerce_option() -> None:
+    """Pass/fail"""
+    result = Coerced(
+        data01="1",
+        data02="false",
+        data03="2022-04-01T00:00:00",
+        data04="high",
+        data05Alias="LOUD",
+        data06={"data01": "nested"},
+    )
+
+    assert result == Coerced(
+        data01=1,
+        data02=False,
+        data03=datetime.datetime(2022, 4, 1),
+        data04=Level.HIGH,
+        data05="loud",
+        data06=NestedNorm(data01="nested"),
+    )
+
+
+def test_coerce_leaves_unconvertible_values() -> None:
+    """Pass/fail"""
+    result = Coerced(data01="one", data02=None)
+
+    assert result.data01 == "one"
+    assert result.data02 is None
+    assert result.data05 is None
+
+
+def test_coerce_metadata_without_option() -> None:
+    """Fields with a converter in metadata convert without the class option"""
+    result = NotCoerced(data01="1", data02="LOUD")
+
+    assert result.data01 == "1"
+    assert result.data02 == "loud"
+
+
+def test_coerce_metadata_on_nested_field() -> None:
+    """Nested fields are built, a converter for one is rejected at compile"""
+
+    @SoftBoiled
+    @dataclasses.dataclass
+    class NestedCoerced:
+        data01: Optional[NestedNorm] = dataclasses.field(
+            default=None, metadata={"coerce": str}
+        )
+
+    with pytest.raises(ValueError, match="data01"):
+        NestedCoerced(data01={"data01": "nested"})
+
+
+def test_coerce_option_skips_nested_fields() -> None:
+    """Pass/fail"""
+    result = Coerced(data06={"data01": "nested"})
+    fields = {field.name: field for field in SoftBoiled.getplan(Coerced.cls).fields}
+
+    assert fields["data06"].converter is None
+    assert result.data06 == NestedNorm(data01="nested")
+
+
+@SoftBoiled.options(validate=2)
+@dataclasses.dataclass
+class Validated:
+    data01: str
+    data02: List[NestedNorm] = dataclasses.field(default_factory=list)
+    data03: Optional[int] = None
+
+
+@pytest.mark.usefixtures("validations")
+def test_validate_samples_one_in_n() -> None:
+    """The first record of every two is checked"""
+    mismatches: List[Any] = []
+    SoftBoiled.onmismatch = lambda *args: mismatches.append(args)
+
+    Validated(data01=1, data02=[{"data01": "x"}], data03="3")
+    Validated(data01=2, data02=["text"], data03="3")
+    Validated(data01="ok", data02=["text"], data03=3)
+
+    assert SoftBoiled.validations.snapshot() == {
+        "softboiled_test:Validated": {
+            "checked": 2,
+            "mismatched": {"data01": 1, "data02": 1, "data03": 1},
+        }
+    }
+    assert mismatches == [
+        (Validated.cls, "data01", 1),
+        (Validated.cls, "data03", "3"),
+        (Validated.cls, "data02", ["text"]),
+    ]
+
+
+@pytest.mark.usefixtures("validations")
+def test_validate_off_by_default() -> None:
+    """Pass/fail"""
+    NestedNorm(data01=1)
+
+    assert SoftBoiled.validations.snapshot() == {}
+
+
+@SoftBoiled.options(lazy=True, validate=1)
+@dataclasses.dataclass
+class ValidatedLazy:
+    data01: Optional[NestedNorm] = None
+
+
+@pytest.mark.usefixtures("validations")
+def test_validate_skips_unbuilt_lazy_fields() -> None:
+    """Pass/fail"""
+    result = ValidatedLazy(data01={"data01": "x"})
+
+    assert SoftBoiled.validations.snapshot()["softboiled_test:ValidatedLazy"] == {
+        "checked": 1,
+        "mismatched": {},
+    }
+    assert result.data01 == NestedNorm(data01="x")
+
+
+def test_validate_must_not_be_negative() -> None:
+    """Pass/fail"""
+    with pytest.raises(ValueError):
+        SoftBoiled.options(validate=-1)(NestedNorm.cls)
+
+
+@SoftBoiled
+@dataclasses.dataclass(frozen=True)
+class FrozenNorm:
+    data01: str = ""
+
+
+@SoftBoiled
+@dataclasses.dataclass
+class Containers:
+    data01: Dict[str, NestedNorm] = dataclasses.field(default_factory=dict)
+    data02: Tuple[NestedNorm, ...] = ()
+    data03: Tuple[str, NestedNorm] = ("", NestedNorm.cls())
+    data04: FrozenSet[FrozenNorm] = frozenset()
+    data05: Optional[List[NestedNorm]] = None
+    data06: List[Dict[str, Optional[NestedNorm]]] = dataclasses.field(
+        default_factory=list
+    )
+
+
+def test_container_nesting() -> None:
+    """Nested models inside containers are built in a single pass"""
+    result = Containers(
+        data01={"a": {"data01": "A"}, "b": {"data01": "B", "extra": 1}},
+        data02=[{"data01": "one"}, {"data01": "two"}],
+        data03=["key", {"data01": "three"}],
+        data04=[{"data01": "x"}, {"data01": "x"}, {"data01": "y"}],
+        data05=None,
+        data06=[{"a": {"data01": "deep"}, "b": None}],
+    )
+
+    assert result.data01 == {"a": NestedNorm(data01="A"), "b": NestedNorm(data01="B")}
+    assert result.data02 == (NestedNorm(data01="one"), NestedNorm(data01="two"))
+    assert result.data03 == ("key", NestedNorm(data01="three"))
+    assert result.data04 == frozenset({FrozenNorm(data01="x"), FrozenNorm(data01="y")})
+    assert result.data05 is None
+    assert result.data06 == [{"a": NestedNorm(data01="deep"), "b": None}]
+
+
+@pytest.mark.parametrize("value", [{"data01": "A"}, "text", 42])
+def test_container_nesting_passes_mismatched_values(value: Any) -> None:
+    """Values not shaped like the container are kept unchanged, as before"""
+    result = Containers(data02=value, data05=value)
+
+    assert result.data02 is value
+    assert result.data05 is value
+
+
+@pytest.mark.parametrize("value", [[{"data01": "A"}], "text", 42])
+def test_mapping_nesting_passes_mismatched_values(value: Any) -> None:
+    """Pass/fail"""
+    assert Containers(data01=value).data01 is value
+
+
+def test_default_factory_used_for_missing() -> None:
+    """Pass/fail"""
+    first = Containers()
+    second = Containers()
+
+    assert first.data01 == {}
+    assert first.data06 == []
+    assert first.data01 is not second.data01
+
+
+def test_nested_accepts_built_instances() -> None:
+    """Already built nested objects pass through unchanged"""
+    inner = NestedLayer(**INNER_NEST)
+
+    result = TopLayer(tdata02=inner, tdata04=[inner])
+
+    assert result.tdata02 is inner
+    assert result.tdata04 == [inner]
+
+
+def _duplicate(module: str, **fields: Any) -> Any:
+    """Create a SoftBoiled dataclass named Dup within the given module"""
+    cls = dataclasses.make_dataclass("Dup", list(fields.items()))
+    cls.__module__ = module
+    return SoftBoiled(cls)
+
+
+def test_same_class_name_in_two_modules() -> None:
+    """Pass/fail"""
+    first = _duplicate("models.billing", amount=int)
+    second = _duplicate("models.support", ticket=str)
+    owner = dataclasses.make_dataclass("Owner", [("dup", "Dup")])
+    owner.__module__ = "models.billing"
+    owner = SoftBoiled(owner)
+
+    result = owner(dup={"amount": 1, "ticket": "x"})
+
+    assert SoftBoiled.registry["models.billing:Dup"] is first
+    assert SoftBoiled.registry["models.support:Dup"] is second
+    assert result.dup == first(amount=1)
+
+
+def test_to_dict_matches_asdict() -> None:
+    """Pass/fail"""
+    result = TopLayer(**TOO_SMALL)
+
+    assert TopLayer.to_dict(result) == dataclasses.asdict(result)
+
+
+def test_to_dict_omit_none() -> None:
+    """Pass/fail"""
+    result = TopLayer(tdata01="top", tdata02={"data01": None, "data02": True})
+
+    assert TopLayer.to_dict(result, omit_none=True) == {
+        "tdata01": "top",
+        "tdata02": {"data02": True},
+    }
+
+
+def test_to_dict_containers_slots_and_lazy() -> None:
+    """Pass/fail"""
+    containers = Containers(data04=[{"data01": "x"}], data06=[{"a": {}}])
+    slotted = SlottedLayer(**INNER_NEST_LARGE)
+    deferred = LazyLayer(tdata01="lazy", tdata02=INNER_NEST)
+
+    assert Containers.to_dict(containers)["data04"] == [{"data01": "x"}]
+    assert Containers.to_dict(containers)["data06"] == [{"a": {"data01": ""}}]
+    assert SlottedLayer.to_dict(slotted) == dataclasses.asdict(slotted)
+    assert LazyLayer.to_dict(deferred)["tdata02"] == INNER_NEST
+
+
+def test_to_json_round_trip() -> None:
+    """Pass/fail"""
+    result = TopLayer(**JUST_RIGHT)
+
+    assert TopLayer.from_json(TopLayer.to_json(result)) == result
@@ -0,0 +1,69 @@
+"""
+Tests for ./softboiled/validation.py
+
+Author: Preocts, discord: Preocts#8196
+"""
+import collections.abc
+from typing import Any
+from typing import Dict
+from typing import ForwardRef
+from typing import FrozenSet
+from typing import List
+from typing import Literal
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+import pytest
+from softboiled import validation
+
+
+class Model:
+    ...
+
+
+T = TypeVar("T")
+
+
+def _asmodel(hint: Any) -> Optional[Type[Any]]:
+    return Model if hint is Model or hint == "Model" else None
+
+
+@pytest.mark.parametrize(
+    ("hint", "valid", "invalid"),
+    [
+        (str, ["", "text"], [None, 1, b"bytes"]),
+        (int, [0, -4], [True, 1.0, "1", None]),
+        (float, [1.5, 2], [False, "1.5"]),
+        (bool, [True, False], [0, "true"]),
+        (None, [None], [0, ""]),
+        (Any, [None, object()], []),
+        (T, [None, 1], []),
+        (ForwardRef("Unresolved"), [1], []),
+        (Model, [Model()], [{}, None, [Model()]]),
+        ("Model", [Model()], [{}]),
+        (Optional[int], [None, 1], ["1"]),
+        (Union[int, str], [1, "1"], [None, 1.5]),
+        (List[int], [[], [1, 2]], [(1,), [1, "2"], None]),
+        (List[Model], [[Model()]], [[{}]]),
+        (Sequence[str], [["a"], ["b"]], [[1]]),
+        (FrozenSet[int], [frozenset({1})], [{1}, frozenset({"1"})]),
+        (Tuple[int, ...], [(), (1, 2)], [[1], (1, "2")]),
+        (Tuple[int, str], [(1, "a")], [(1,), ("a", 1), [1, "a"]]),
+        (Dict[str, int], [{}, {"a": 1}], [{"a": "1"}, {1: 1}, []]),
+        (Mapping[str, List[Model]], [{"a": [Model()]}], [{"a": [{}]}]),
+        (Dict, [{"a": object()}], [[]]),
+        (collections.abc.Iterable, [[1], "str"], [1]),
+        (Literal["a", "b"], ["a", "b"], ["c", None]),
+    ],
+)
+def test_checkers(hint: Any, valid: List[Any], invalid: List[Any]) -> None:
+    """Pass/fail"""
+    check = validation.make_checker(hint, _asmodel)
+
+    assert all(check(value) for value in valid)
+    assert not any(check(value) for value in invalid)